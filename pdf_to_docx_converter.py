@@ -13,21 +13,36 @@ A command-line utility to convert PDF files to DOCX format using the pdf2docx li
 Scans the current working directory for PDF files and converts them to DOCX format.
 """
 
+import gc
+import math
+import mmap
 import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import List, Optional
-from pdf2docx import Converter
 
 
-@dataclass
+# Files with more pages than this are converted with page-range sharding
+LARGE_PDF_PAGE_THRESHOLD = 50
+
+# Conversions a pool worker runs before it is replaced by a fresh process (Python 3.11+)
+POOL_MAX_TASKS_PER_CHILD = 50
+
+# pdf2docx Converter class, imported on first use (see _get_converter_cls)
+_Converter = None
+
+
+@dataclass(slots=True, frozen=True)
 class ConversionResult:
     """Data class to track individual file conversion status"""
     file_name: str
-    status: str  # 'success', 'failed', 'skipped'
+    status: str  # 'success', 'failed', 'skipped' ('deferred' only between batch stages)
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversionSummary:
     """Data class to track overall batch conversion results"""
     total_files: int
@@ -59,13 +74,12 @@ def get_pdf_files(directory_path: str) -> List[str]:
         raise NotADirectoryError(f"Path is not a directory: {directory_path}")
     
     try:
-        pdf_files = []
-        for file_name in os.listdir(directory_path):
-            file_path = os.path.join(directory_path, file_name)
-            
-            # Check if it's a file (not a directory) and has .pdf extension
-            if os.path.isfile(file_path) and file_name.lower().endswith('.pdf'):
-                pdf_files.append(file_path)
+        # DirEntry.is_file() is answered from the directory listing, avoiding a stat per entry
+        with os.scandir(directory_path) as entries:
+            pdf_files = [
+                entry.path for entry in entries
+                if entry.name.lower().endswith('.pdf') and entry.is_file()
+            ]
         
         return sorted(pdf_files)  # Return sorted list for consistent ordering
         
@@ -73,12 +87,14 @@ def get_pdf_files(directory_path: str) -> List[str]:
         raise PermissionError(f"Permission denied accessing directory: {directory_path}") from e
 
 
-def is_valid_pdf_file(pdf_path: str) -> tuple[bool, str]:
+def is_valid_pdf_file(pdf_path: str, prefetch: bool = False) -> tuple[bool, str]:
     """
     Check if a file is a valid PDF by examining its structure
     
     Args:
         pdf_path: Path to the PDF file to validate
+        prefetch: If True and the file is valid, ask the kernel to start reading the
+            whole file ahead of the upcoming conversion (POSIX only)
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -86,33 +102,30 @@ def is_valid_pdf_file(pdf_path: str) -> tuple[bool, str]:
         - error_message: Description of the issue if not valid, empty string if valid
     """
     try:
-        with open(pdf_path, 'rb') as f:
-            # Read first 1024 bytes to check PDF structure
-            header = f.read(1024)
-            
-            # Check for PDF header
-            if not header.startswith(b'%PDF'):
+        # Unbuffered, so the header check is a single 5-byte read with no buffer allocation
+        with open(pdf_path, 'rb', buffering=0) as f:
+            # Reject non-PDF and empty files before touching anything else
+            if f.read(5) != b'%PDF-':
                 return False, "File does not have a valid PDF header"
             
-            # Check file size first - empty or very small files are likely invalid
-            f.seek(0, 2)  # Seek to end
-            file_size = f.tell()
-            if file_size < 100:  # PDF files should be at least 100 bytes
-                return False, "File is too small to be a valid PDF"
+            file_size = os.fstat(f.fileno()).st_size
             
-            # Check for basic PDF structure markers
-            if b'obj' not in header and b'endobj' not in header:
-                # Read more of the file to look for object markers
-                f.seek(0)
-                content = f.read(4096)
-                if b'obj' not in content:
+            # Map the file once and search it in place instead of reading into buffers
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Check for basic PDF structure markers ('endobj' contains 'obj')
+                if mm.find(b'obj', 0, min(file_size, 4096)) == -1:
                     return False, "File does not contain valid PDF object structure"
+                
+                # Look for EOF marker near the end of file
+                if mm.rfind(b'%%EOF', max(0, file_size - 1024)) == -1:
+                    return False, "File does not have a valid PDF end marker"
             
-            # Look for EOF marker near the end of file
-            f.seek(max(0, file_size - 1024))
-            tail = f.read()
-            if b'%%EOF' not in tail:
-                return False, "File does not have a valid PDF end marker"
+            # Start async readahead so disk I/O overlaps with converter setup
+            if prefetch and hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                except OSError:
+                    pass  # Advisory only; some filesystems don't support it
             
         return True, ""
         
@@ -143,8 +156,8 @@ def validate_file_accessibility(pdf_path: str, docx_path: str) -> None:
     
     # Check if PDF file is readable and valid
     try:
-        # Validate PDF file structure
-        is_valid, error_msg = is_valid_pdf_file(pdf_path)
+        # Validate PDF file structure and prefetch it for the converter
+        is_valid, error_msg = is_valid_pdf_file(pdf_path, prefetch=True)
         if not is_valid:
             raise ValueError(f"Invalid PDF file: {error_msg}")
             
@@ -163,30 +176,57 @@ def validate_file_accessibility(pdf_path: str, docx_path: str) -> None:
     if output_dir and not os.path.exists(output_dir):
         raise FileNotFoundError(f"Output directory does not exist: {output_dir}")
     
-    # Test write permissions by creating a temporary file
-    try:
-        temp_file = docx_path + ".tmp"
-        with open(temp_file, 'w') as f:
-            f.write("test")
-        os.remove(temp_file)
-    except PermissionError:
+    # Check write permission on the output directory without touching the disk
+    if not os.access(output_dir or os.path.dirname(os.path.abspath(docx_path)), os.W_OK):
         raise PermissionError(f"Permission denied writing to output location: {docx_path}")
-    except OSError as e:
-        raise OSError(f"Cannot write to output location: {docx_path} - {e}")
 
 
-def convert_pdf_to_docx(pdf_path: str, docx_path: str) -> bool:
+def _get_converter_cls():
+    """
+    Return the pdf2docx Converter class, importing it on first use
+    
+    pdf2docx pulls in PyMuPDF, python-docx and fontTools, so the import is deferred
+    until a conversion is needed and then cached for the life of the process
+    (including each worker process of the batch pool).
+    
+    Returns:
+        The pdf2docx.Converter class
+        
+    Raises:
+        ImportError: If pdf2docx is not installed
+    """
+    global _Converter
+    if _Converter is None:
+        from pdf2docx import Converter as _Converter
+    return _Converter
+
+
+class _LargePdfDeferred(Exception):
+    """Raised by convert_pdf_to_docx when a document has more than max_pages pages"""
+
+
+def convert_pdf_to_docx(pdf_path: str, docx_path: str, workers: int = 1, shard_size: int = 10,
+                        max_pages: Optional[int] = None) -> bool:
     """
     Handle individual PDF to DOCX conversion using pdf2docx Converter class
     
+    The document opened by the Converter is also used for the encryption and page
+    count checks, so the PDF is only parsed once in this process.
+    
     Args:
         pdf_path: Path to the input PDF file
         docx_path: Path where the output DOCX file should be saved
+        workers: Maximum number of processes pdf2docx may parse page ranges with
+            (1 = single process)
+        shard_size: Minimum number of pages handled by each worker process
+        max_pages: Page count above which the file is left unconverted, so the
+            caller can convert it with page-range sharding (None = no limit)
         
     Returns:
         True if conversion was successful, False otherwise
         
     Raises:
+        _LargePdfDeferred: If the document has more than max_pages pages
         FileNotFoundError: If the PDF file doesn't exist
         PermissionError: If there are permission issues with file access
         ValueError: If the file is not a valid PDF
@@ -200,7 +240,7 @@ def convert_pdf_to_docx(pdf_path: str, docx_path: str) -> bool:
     try:
         # Create converter instance with enhanced error handling
         try:
-            cv = Converter(pdf_path)
+            cv = _get_converter_cls()(pdf_path)
         except Exception as e:
             # Enhance error message for converter creation failures
             if "password" in str(e).lower() or "encrypted" in str(e).lower():
@@ -210,9 +250,28 @@ def convert_pdf_to_docx(pdf_path: str, docx_path: str) -> bool:
             else:
                 raise Exception(f"Failed to initialize PDF converter: {e}")
         
+        # Check the already-parsed document instead of opening the PDF a second time
+        fitz_doc = cv.fitz_doc
+        if fitz_doc.needs_pass:
+            raise Exception(f"PDF is password-protected: {pdf_path}")
+        if not fitz_doc.is_pdf or fitz_doc.page_count == 0:
+            raise ValueError(f"Invalid PDF file: document has no readable pages: {pdf_path}")
+        
+        page_count = fitz_doc.page_count
+        if max_pages is not None and page_count > max_pages:
+            raise _LargePdfDeferred(f"{page_count} pages: {pdf_path}")
+        
+        # Small documents don't amortize the cost of starting worker processes
+        shard_count = 1
+        if workers > 1 and page_count >= 2 * shard_size:
+            shard_count = min(workers, math.ceil(page_count / shard_size))
+        
         # Perform the conversion with timeout protection
         try:
-            cv.convert(docx_path)
+            if shard_count > 1:
+                cv.convert(docx_path, multi_processing=True, cpu_count=shard_count)
+            else:
+                cv.convert(docx_path)
         except Exception as e:
             # Enhance error messages for conversion failures
             error_msg = str(e).lower()
@@ -225,16 +284,21 @@ def convert_pdf_to_docx(pdf_path: str, docx_path: str) -> bool:
             else:
                 raise e
         
-        # Verify the output file was created and is valid
-        if not os.path.exists(docx_path):
+        # Verify the output file was created and is not empty with a single stat
+        try:
+            output_size = os.stat(docx_path).st_size
+        except FileNotFoundError:
             raise Exception(f"Conversion completed but output file not found: {docx_path}")
         
-        # Check if output file has reasonable size (not empty)
-        if os.path.getsize(docx_path) == 0:
+        if output_size == 0:
             raise Exception(f"Conversion produced empty output file: {docx_path}")
         
         return True
         
+    except _LargePdfDeferred:
+        # Nothing was written, so an existing DOCX must be left in place
+        raise
+        
     except Exception as e:
         # Clean up partial output file if it exists
         if os.path.exists(docx_path):
@@ -255,6 +319,33 @@ def convert_pdf_to_docx(pdf_path: str, docx_path: str) -> bool:
                 pass  # Ignore cleanup errors
 
 
+def convert_pdf_to_docx_parallel(pdf_path: str, docx_path: str, shard_size: int = 10,
+                                 workers: Optional[int] = None) -> bool:
+    """
+    Convert a large PDF by parsing page ranges in parallel worker processes
+    
+    The document is split into at most `workers` contiguous page ranges of at least
+    `shard_size` pages each. pdf2docx parses every range in its own process and
+    assembles the parsed pages into a single DOCX, so section and style continuity
+    are preserved without merging separate DOCX files afterwards. Documents with
+    fewer than 2 * shard_size pages are converted in a single process.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        docx_path: Path where the output DOCX file should be saved
+        shard_size: Minimum number of pages handled by each worker
+        workers: Maximum number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        True if conversion was successful, False otherwise
+        
+    Raises:
+        Same exceptions as convert_pdf_to_docx
+    """
+    workers = workers or os.cpu_count() or 1
+    return convert_pdf_to_docx(pdf_path, docx_path, workers=workers, shard_size=shard_size)
+
+
 def check_file_exists(file_path: str) -> bool:
     """
     Check if a file exists at the given path
@@ -278,15 +369,96 @@ def generate_docx_path(pdf_path: str) -> str:
     Returns:
         Path for the output DOCX file (same directory, same name, .docx extension)
     """
-    # Get the directory and filename without extension
-    directory = os.path.dirname(pdf_path)
-    filename_without_ext = os.path.splitext(os.path.basename(pdf_path))[0]
-    
-    # Create the DOCX path
-    docx_filename = f"{filename_without_ext}.docx"
-    docx_path = os.path.join(directory, docx_filename)
-    
-    return docx_path
+    # Only the extension changes, so swap it in place instead of splitting and re-joining
+    head, dot, extension = pdf_path.rpartition('.')
+    
+    # No extension, or the last dot belongs to a directory name or a leading-dot filename
+    stem = head.rstrip('.')
+    if not dot or os.sep in extension or (os.altsep and os.altsep in extension) \
+            or not stem or stem[-1] in (os.sep, os.altsep):
+        return pdf_path + '.docx'
+    
+    return head + '.docx'
+
+
+def _is_pdf2docx_error(error: Exception) -> bool:
+    """Check whether an exception was raised from inside the pdf2docx package"""
+    return 'pdf2docx' in str(getattr(error, '__module__', ''))
+
+
+# Error message templates and guidance lines, keyed by error category
+_ERROR_GUIDANCE = {
+    'import': ("Import Error for {file_name}", (
+        "Please install the required pdf2docx library: pip install pdf2docx",
+    )),
+    'not-found': ("File Not Found for {file_name}", (
+        "The PDF file may have been moved or deleted during processing",
+    )),
+    'permission': ("Permission Error for {file_name}", (
+        "Check file permissions and ensure you have read/write access",
+        "Try running with elevated permissions or check file ownership",
+    )),
+    'disk-space': ("Disk Space Error for {file_name}", (
+        "Insufficient disk space to complete the conversion",
+        "Free up disk space and try again",
+    )),
+    'system-memory': ("Memory Error for {file_name}", (
+        "Insufficient memory to process this PDF file",
+        "Try closing other applications or processing smaller files",
+    )),
+    'system': ("System Error for {file_name}", (
+        "A system-level error occurred during file processing",
+    )),
+    'password': ("Password Protected PDF for {file_name}", (
+        "This PDF is password-protected and cannot be converted",
+        "Remove password protection or use a different file",
+    )),
+    'corrupted': ("Corrupted PDF for {file_name}", (
+        "The PDF file appears to be corrupted or damaged",
+        "Try opening the file in a PDF viewer to verify its integrity",
+    )),
+    'unsupported': ("Unsupported PDF Format for {file_name}", (
+        "This PDF format is not supported by the converter",
+        "Try converting the PDF to a standard format first",
+    )),
+    'pdf2docx': ("PDF Conversion Error for {file_name}", (
+        "The PDF file may be corrupted, password-protected, or in an unsupported format",
+    )),
+    'memory': ("Memory Error for {file_name}", (
+        "The PDF file is too large to process with available memory",
+        "Try processing smaller files or increase available memory",
+    )),
+    'encoding': ("Encoding Error for {file_name}", (
+        "The PDF contains characters that cannot be properly encoded",
+        "The file may contain special fonts or non-standard text encoding",
+    )),
+    'unexpected': ("Unexpected Error for {file_name} ({error_type})", (
+        "An unexpected error occurred during conversion",
+        "Please check the PDF file integrity and try again",
+    )),
+}
+
+# Ordered (exception type or predicate, ((keywords, category), ...), default category) rules.
+# The first matching entry wins; its keyword rules refine the category from the message.
+_ERROR_DISPATCH = (
+    (ImportError, (), 'import'),
+    (FileNotFoundError, (), 'not-found'),
+    (PermissionError, (), 'permission'),
+    (OSError, (
+        (('disk', 'space'), 'disk-space'),
+        (('memory',), 'system-memory'),
+    ), 'system'),
+    (_is_pdf2docx_error, (
+        (('password', 'encrypted'), 'password'),
+        (('corrupt', 'invalid', 'damaged'), 'corrupted'),
+        (('unsupported', 'format'), 'unsupported'),
+    ), 'pdf2docx'),
+    (MemoryError, (), 'memory'),
+    (UnicodeError, (), 'encoding'),
+    (Exception, (
+        (('password', 'encrypted'), 'password'),
+    ), 'unexpected'),
+)
 
 
 def handle_conversion_error(error: Exception, file_name: str) -> None:
@@ -300,56 +472,22 @@ def handle_conversion_error(error: Exception, file_name: str) -> None:
     error_type = type(error).__name__
     error_message = str(error).lower()
     
-    if isinstance(error, ImportError):
-        print(f"❌ Import Error for {file_name}: {error}")
-        print("   Please install the required pdf2docx library: pip install pdf2docx")
-    elif isinstance(error, FileNotFoundError):
-        print(f"❌ File Not Found for {file_name}: {error}")
-        print("   The PDF file may have been moved or deleted during processing")
-    elif isinstance(error, PermissionError):
-        print(f"❌ Permission Error for {file_name}: {error}")
-        print("   Check file permissions and ensure you have read/write access")
-        print("   Try running with elevated permissions or check file ownership")
-    elif isinstance(error, OSError):
-        if "disk" in error_message or "space" in error_message:
-            print(f"❌ Disk Space Error for {file_name}: {error}")
-            print("   Insufficient disk space to complete the conversion")
-            print("   Free up disk space and try again")
-        elif "memory" in error_message:
-            print(f"❌ Memory Error for {file_name}: {error}")
-            print("   Insufficient memory to process this PDF file")
-            print("   Try closing other applications or processing smaller files")
-        else:
-            print(f"❌ System Error for {file_name}: {error}")
-            print("   A system-level error occurred during file processing")
-    elif hasattr(error, '__module__') and 'pdf2docx' in str(error.__module__):
-        if "password" in error_message or "encrypted" in error_message:
-            print(f"❌ Password Protected PDF for {file_name}: {error}")
-            print("   This PDF is password-protected and cannot be converted")
-            print("   Remove password protection or use a different file")
-        elif "corrupt" in error_message or "invalid" in error_message or "damaged" in error_message:
-            print(f"❌ Corrupted PDF for {file_name}: {error}")
-            print("   The PDF file appears to be corrupted or damaged")
-            print("   Try opening the file in a PDF viewer to verify its integrity")
-        elif "unsupported" in error_message or "format" in error_message:
-            print(f"❌ Unsupported PDF Format for {file_name}: {error}")
-            print("   This PDF format is not supported by the converter")
-            print("   Try converting the PDF to a standard format first")
-        else:
-            print(f"❌ PDF Conversion Error for {file_name}: {error}")
-            print("   The PDF file may be corrupted, password-protected, or in an unsupported format")
-    elif isinstance(error, MemoryError):
-        print(f"❌ Memory Error for {file_name}: {error}")
-        print("   The PDF file is too large to process with available memory")
-        print("   Try processing smaller files or increase available memory")
-    elif isinstance(error, UnicodeError):
-        print(f"❌ Encoding Error for {file_name}: {error}")
-        print("   The PDF contains characters that cannot be properly encoded")
-        print("   The file may contain special fonts or non-standard text encoding")
-    else:
-        print(f"❌ Unexpected Error for {file_name} ({error_type}): {error}")
-        print("   An unexpected error occurred during conversion")
-        print("   Please check the PDF file integrity and try again")
+    # Walk the dispatch table once to find the error category
+    category = 'unexpected'
+    for matcher, keyword_rules, default_category in _ERROR_DISPATCH:
+        matched = isinstance(error, matcher) if isinstance(matcher, type) else matcher(error)
+        if matched:
+            category = default_category
+            for keywords, keyword_category in keyword_rules:
+                if any(keyword in error_message for keyword in keywords):
+                    category = keyword_category
+                    break
+            break
+    
+    title, guidance = _ERROR_GUIDANCE[category]
+    lines = [f"❌ {title.format(file_name=file_name, error_type=error_type)}: {error}"]
+    lines.extend(f"   {line}" for line in guidance)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def check_dependencies() -> bool:
@@ -372,12 +510,14 @@ def _check_dependencies_impl() -> bool:
     try:
         # Try to import pdf2docx to verify it's installed
         import pdf2docx
-        from pdf2docx import Converter
         
         # Check if we can access the main Converter class
         if not hasattr(pdf2docx, 'Converter'):
             print("❌ Error: pdf2docx library is installed but Converter class is not available")
             return False
+        
+        # Load the Converter class now so conversions don't pay the import again
+        _get_converter_cls()
             
         print("✅ Dependencies check passed: pdf2docx is available")
         return True
@@ -402,10 +542,10 @@ def display_progress(current: int, total: int, file_name: str) -> None:
         file_name: Name of the current file being processed
     """
     if total <= 0:
-        print(f"🔄 Processing: {file_name}")
+        sys.stdout.write(f"🔄 Processing: {file_name}\n")
     else:
         percentage = (current / total) * 100
-        print(f"🔄 Processing ({current}/{total} - {percentage:.0f}%): {file_name}")
+        sys.stdout.write(f"🔄 Processing ({current}/{total} - {percentage:.0f}%): {file_name}\n")
 
 
 def display_file_count(count: int) -> None:
@@ -470,6 +610,35 @@ def should_convert_file(pdf_path: str, docx_path: str) -> bool:
     return prompt_overwrite(docx_filename)
 
 
+def collect_overwrite_decisions(pdf_files: List[str]) -> tuple[List[str], List[str]]:
+    """
+    Resolve overwrite protection for a whole batch in a single pass
+    
+    Prompts once for every PDF whose DOCX output already exists, so the conversion
+    loop that follows never has to stop for user input.
+    
+    Args:
+        pdf_files: Paths of the PDF files in the batch
+        
+    Returns:
+        Tuple of (to_convert, skipped)
+        - to_convert: PDF paths that should be converted
+        - skipped: PDF paths whose existing DOCX the user chose to keep
+    """
+    to_convert = []
+    skipped = []
+    
+    for pdf_path in pdf_files:
+        docx_path = generate_docx_path(pdf_path)
+        
+        if check_file_exists(docx_path) and not prompt_overwrite(os.path.basename(docx_path)):
+            skipped.append(pdf_path)
+        else:
+            to_convert.append(pdf_path)
+    
+    return to_convert, skipped
+
+
 def display_summary(successful: int, failed: int, skipped: int) -> None:
     """
     Display final conversion results summary
@@ -481,31 +650,30 @@ def display_summary(successful: int, failed: int, skipped: int) -> None:
     """
     total = successful + failed + skipped
     
-    print("\n" + "=" * 50)
-    print("📊 CONVERSION SUMMARY")
-    print("=" * 50)
+    # Build the whole summary first and emit it with a single write
+    lines = ["", "=" * 50, "📊 CONVERSION SUMMARY", "=" * 50]
     
     if total == 0:
-        print("No files were processed")
-        return
-    
-    print(f"Total files processed: {total}")
-    
-    if successful > 0:
-        print(f"✅ Successfully converted: {successful}")
-    
-    if failed > 0:
-        print(f"❌ Failed conversions: {failed}")
-    
-    if skipped > 0:
-        print(f"⏭️  Skipped files: {skipped}")
-    
-    # Calculate and display success rate
-    if total > 0:
+        lines.append("No files were processed")
+    else:
+        lines.append(f"Total files processed: {total}")
+        
+        if successful > 0:
+            lines.append(f"✅ Successfully converted: {successful}")
+        
+        if failed > 0:
+            lines.append(f"❌ Failed conversions: {failed}")
+        
+        if skipped > 0:
+            lines.append(f"⏭️  Skipped files: {skipped}")
+        
+        # Calculate and display success rate
         success_rate = (successful / total) * 100
-        print(f"📈 Success rate: {success_rate:.1f}%")
+        lines.append(f"📈 Success rate: {success_rate:.1f}%")
+        lines.append("=" * 50)
     
-    print("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def display_conversion_success(file_name: str) -> None:
@@ -515,7 +683,7 @@ def display_conversion_success(file_name: str) -> None:
     Args:
         file_name: Name of the file that was successfully converted
     """
-    print(f"✅ Successfully converted: {file_name}")
+    sys.stdout.write(f"✅ Successfully converted: {file_name}\n")
 
 
 def display_conversion_skipped(file_name: str) -> None:
@@ -525,7 +693,105 @@ def display_conversion_skipped(file_name: str) -> None:
     Args:
         file_name: Name of the file that was skipped
     """
-    print(f"⏭️  Skipped (file exists): {file_name}")
+    sys.stdout.write(f"⏭️  Skipped (file exists): {file_name}\n")
+
+
+def _convert_one(pdf_path: str, workers: int = 1, max_pages: Optional[int] = None) -> ConversionResult:
+    """
+    Convert a single PDF file inside a worker process
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor. Validation
+    runs here too (via convert_pdf_to_docx), so checking one file overlaps with
+    converting others instead of being staged in the parent. Conversion errors are
+    not caught here; they propagate through the future so the parent process can
+    report them with handle_conversion_error.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        workers: Number of processes used to parse the pages of this file
+        max_pages: Page count above which the file is not converted here and a
+            'deferred' result is returned instead (None = no limit)
+        
+    Returns:
+        ConversionResult describing the outcome of the conversion
+    """
+    pdf_filename = os.path.basename(pdf_path)
+    docx_path = generate_docx_path(pdf_path)
+    
+    try:
+        if workers > 1:
+            success = convert_pdf_to_docx_parallel(pdf_path, docx_path, workers=workers)
+        else:
+            success = convert_pdf_to_docx(pdf_path, docx_path, max_pages=max_pages)
+    except _LargePdfDeferred:
+        return ConversionResult(file_name=pdf_filename, status='deferred')
+    finally:
+        # Free the page layout trees now rather than letting them pile up across files
+        gc.collect()
+    
+    if success:
+        return ConversionResult(file_name=pdf_filename, status='success')
+    
+    # This shouldn't happen with current implementation, but handle it
+    return ConversionResult(
+        file_name=pdf_filename,
+        status='failed',
+        error_message='Unknown conversion error'
+    )
+
+
+def _iter_conversion_outcomes(pdf_files: List[str]):
+    """
+    Convert files and yield their outcomes as they become available
+    
+    Files are converted concurrently by a process pool. A worker that finds more
+    than LARGE_PDF_PAGE_THRESHOLD pages in the document it has already opened hands
+    the file back; those files are converted one at a time afterwards, each sharded
+    across all CPU cores. The parent never opens a PDF itself.
+    
+    Args:
+        pdf_files: PDF paths to convert
+        
+    Yields:
+        Tuples of (pdf_path, result, error) where exactly one of result/error is set
+    """
+    large_files = []
+    
+    if pdf_files:
+        pool_kwargs = {'max_workers': min(os.cpu_count() or 1, 4)}
+        if sys.version_info >= (3, 11):
+            # Recycle workers periodically to bound native heap fragmentation in fitz
+            pool_kwargs['max_tasks_per_child'] = POOL_MAX_TASKS_PER_CHILD
+        
+        with ProcessPoolExecutor(**pool_kwargs) as executor:
+            futures = {
+                executor.submit(_convert_one, pdf_path, max_pages=LARGE_PDF_PAGE_THRESHOLD): pdf_path
+                for pdf_path in pdf_files
+            }
+            
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as error:
+                    yield futures[future], None, error
+                    continue
+                
+                if result.status == 'deferred':
+                    large_files.append(futures[future])
+                else:
+                    yield futures[future], result, None
+    
+    if large_files:
+        # pdf2docx's multi-processing path writes and removes pages-{i}.json in the
+        # working directory, so it runs in a child process working in a scratch directory
+        with tempfile.TemporaryDirectory() as scratch_dir, \
+                ProcessPoolExecutor(max_workers=1, initializer=os.chdir, initargs=(scratch_dir,)) as executor:
+            for pdf_path in sorted(large_files, key=pdf_files.index):
+                future = executor.submit(_convert_one, os.path.abspath(pdf_path), workers=os.cpu_count() or 1)
+                try:
+                    yield pdf_path, future.result(), None
+                except Exception as error:
+                    yield pdf_path, None, error
 
 
 def pdf_to_docx_batch_convert() -> None:
@@ -535,6 +801,10 @@ def pdf_to_docx_batch_convert() -> None:
     This function integrates file discovery, conversion, error handling, and progress feedback.
     It continues processing after individual file failures and tracks conversion statistics.
     
+    Overwrite prompts are answered up front in the main process, then the approved
+    files are validated and converted in parallel by a process pool (pdf2docx is
+    CPU-bound per file).
+    
     Requirements addressed:
     - 1.1: Scan current working directory for PDF files and convert to DOCX
     - 2.1: Handle errors gracefully and continue with next file
@@ -563,49 +833,29 @@ def pdf_to_docx_batch_convert() -> None:
         
         print()  # Add blank line for better readability
         
-        # Process each PDF file
-        for index, pdf_path in enumerate(pdf_files, 1):
+        # Answer all overwrite prompts before any conversion work starts
+        to_convert, skipped_files = collect_overwrite_decisions(pdf_files)
+        
+        for pdf_path in skipped_files:
+            # User declined to overwrite existing file
+            pdf_filename = os.path.basename(pdf_path)
+            display_conversion_skipped(pdf_filename)
+            skipped_count += 1
+            conversion_results.append(ConversionResult(
+                file_name=pdf_filename,
+                status='skipped',
+                error_message='User declined to overwrite existing DOCX file'
+            ))
+        
+        # Convert the approved files, reporting results as they complete
+        outcomes = _iter_conversion_outcomes(to_convert)
+        for index, (pdf_path, result, error) in enumerate(outcomes, 1):
             pdf_filename = os.path.basename(pdf_path)
-            docx_path = generate_docx_path(pdf_path)
-            docx_filename = os.path.basename(docx_path)
             
             # Display progress
-            display_progress(index, len(pdf_files), pdf_filename)
+            display_progress(index, len(to_convert), pdf_filename)
             
-            try:
-                # Check if we should convert this file (handles overwrite protection)
-                if not should_convert_file(pdf_path, docx_path):
-                    # User declined to overwrite existing file
-                    display_conversion_skipped(pdf_filename)
-                    skipped_count += 1
-                    conversion_results.append(ConversionResult(
-                        file_name=pdf_filename,
-                        status='skipped',
-                        error_message='User declined to overwrite existing DOCX file'
-                    ))
-                    continue
-                
-                # Attempt the conversion
-                success = convert_pdf_to_docx(pdf_path, docx_path)
-                
-                if success:
-                    display_conversion_success(pdf_filename)
-                    successful_count += 1
-                    conversion_results.append(ConversionResult(
-                        file_name=pdf_filename,
-                        status='success'
-                    ))
-                else:
-                    # This shouldn't happen with current implementation, but handle it
-                    print(f"❌ Conversion failed for {pdf_filename}: Unknown error")
-                    failed_count += 1
-                    conversion_results.append(ConversionResult(
-                        file_name=pdf_filename,
-                        status='failed',
-                        error_message='Unknown conversion error'
-                    ))
-                
-            except Exception as error:
+            if error is not None:
                 # Handle conversion error gracefully and continue with next file
                 handle_conversion_error(error, pdf_filename)
                 failed_count += 1
@@ -614,8 +864,15 @@ def pdf_to_docx_batch_convert() -> None:
                     status='failed',
                     error_message=str(error)
                 ))
-                # Continue processing the next file
                 continue
+            
+            if result.status == 'success':
+                display_conversion_success(pdf_filename)
+                successful_count += 1
+            else:
+                print(f"❌ Conversion failed for {pdf_filename}: {result.error_message}")
+                failed_count += 1
+            conversion_results.append(result)
         
         # Display final summary
         display_summary(successful_count, failed_count, skipped_count)
@@ -8,7 +8,8 @@ Usage: python pdf_to_docx_single.py <pdf_file_path>
 
 import os
 import sys
-from pdf2docx import Converter
+
+from pdf_to_docx_converter import check_file_exists, convert_pdf_to_docx, generate_docx_path
 
 
 def check_dependencies():
@@ -26,50 +27,56 @@ def convert_single_pdf(pdf_path, output_path=None):
     """
     转换单个PDF文件到DOCX格式
     
+    校验、转换和失败清理都复用 pdf_to_docx_converter 中的实现。
+    
     Args:
         pdf_path: PDF文件路径
         output_path: 输出DOCX文件路径（可选，默认为同名.docx文件）
     """
-    # 检查PDF文件是否存在
-    if not os.path.exists(pdf_path):
+    # 检查PDF文件是否存在（在询问是否覆盖之前）
+    if not os.path.isfile(pdf_path):
         print(f"❌ 错误: PDF文件不存在: {pdf_path}")
         return False
     
     # 如果没有指定输出路径，生成默认路径
     if output_path is None:
-        base_name = os.path.splitext(pdf_path)[0]
-        output_path = f"{base_name}.docx"
+        output_path = generate_docx_path(pdf_path)
     
     # 检查输出文件是否已存在
-    if os.path.exists(output_path):
-        response = input(f"⚠️  文件 '{output_path}' 已存在，是否覆盖? (y/n): ").strip().lower()
-        if response not in ['y', 'yes', '是']:
-            print("❌ 转换已取消")
-            return False
+    if check_file_exists(output_path) and not confirm_overwrite(output_path):
+        print("❌ 转换已取消")
+        return False
     
     print(f"🔄 开始转换: {os.path.basename(pdf_path)}")
     
     try:
-        # 执行转换
-        cv = Converter(pdf_path)
-        cv.convert(output_path)
-        cv.close()
+        # 执行转换（失败时部分输出文件会被自动清理）
+        convert_pdf_to_docx(pdf_path, output_path)
         
         print(f"✅ 转换成功: {os.path.basename(output_path)}")
         print(f"   输出文件: {output_path}")
         return True
         
+    except FileNotFoundError as e:
+        # PDF已确认存在，这里是输出目录等其他路径不存在
+        print(f"❌ 错误: 文件或目录不存在: {e.filename or e}")
+        return False
     except Exception as e:
         print(f"❌ 转换失败: {e}")
-        # 清理可能的部分输出文件
-        if os.path.exists(output_path):
-            try:
-                os.remove(output_path)
-            except:
-                pass
         return False
 
 
+def confirm_overwrite(output_path):
+    """询问是否覆盖已存在的输出文件（接受 y / yes / 是）"""
+    try:
+        response = input(f"⚠️  文件 '{output_path}' 已存在，是否覆盖? (y/n): ").strip().lower()
+    except (EOFError, KeyboardInterrupt):
+        print()
+        return False
+    
+    return response in ['y', 'yes', '是']
+
+
 def main():
     """主函数"""
     print("PDF to DOCX 单文件转换器")
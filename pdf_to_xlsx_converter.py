@@ -6,17 +6,43 @@ A command-line utility to convert PDF files to XLSX format by extracting tables.
 Scans the current working directory for PDF files and converts them to XLSX format.
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import csv
+import functools
+import hashlib
+import importlib.util
+import itertools
+import io
+import json
+import mmap
+import multiprocessing.util
 import os
+import pickle
+import re
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import List, Optional
-import pandas as pd
-import tabula
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set
+import numpy as np
+from openpyxl import Workbook, load_workbook
+from openpyxl.packaging.custom import StringProperty
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# pandas and tabula take a noticeable time to import, so they are loaded on first use
+# by _import_table_libraries; runs that find nothing to convert never pay for them
+if TYPE_CHECKING:
+    import pandas as pd
+    import tabula
+else:
+    pd = None
+    tabula = None
+
 # Optional import for pdfplumber as backup
 try:
     import pdfplumber
@@ -24,6 +50,118 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+# Optional import for xlsxwriter as the fast XLSX writer (openpyxl is the fallback)
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Optional import for pypdf to reject empty or password-protected PDFs before starting Java
+try:
+    import pypdf
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# Extracted tables are cached here, keyed by the SHA-256 of the source PDF
+TABLE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdfconvert')
+
+# Bump when extraction or cleaning changes so stale cache entries are ignored
+TABLE_CACHE_VERSION = 1
+
+# Per-directory record of generated XLSX files: {xlsx name: {"sha256": ..., "mtime": ...}}
+MANIFEST_FILE_NAME = ".pdfconvert_cache.json"
+
+# Batch results are appended here as each chunk finishes, instead of kept in memory
+RESULTS_FILE_NAME = "pdfconvert_results.csv"
+
+# Number of PDF files prompted for and converted together before results are flushed
+BATCH_CHUNK_SIZE = 50
+
+# Separates cells in text lines that look like table rows: a tab or a run of 2+ spaces
+_CELL_SEPARATOR_RE = re.compile(r' {2,}|\t')
+
+# Cell text coerce_numeric_cells treats as a number: only digits and . , % - with at least one digit
+_NUMERIC_TEXT_RE = re.compile(r'[\d.,%-]*\d[\d.,%-]*')
+
+# Classifies a lower-cased error message for handle_xlsx_conversion_error: (hint key,
+# keywords that must all occur). Rules are checked in order and the first match wins,
+# wherever the keywords occur in the message.
+_ERROR_HINT_RULES = (
+    ('java', ('java',)),
+    ('table', ('table', 'not found')),
+    ('memory', ('memory',)),
+    ('timeout', ('timeout',)),
+    ('excel', ('excel',)),
+    ('excel', ('xlsx',)),
+    ('disk', ('disk',)),
+    ('disk', ('space',)),
+)
+
+# Guidance printed for each _ERROR_HINT_RULES key, and for messages matching none of them
+_ERROR_HINTS = {
+    'java': (
+        "Java Runtime Error - tabula-py requires Java to be installed",
+        "Please install Java from: https://www.java.com/download/",
+        "Ensure Java is in your system PATH",
+    ),
+    'table': (
+        "No tables were found in the PDF file",
+        "This could mean:",
+        "  • The PDF contains only text without tabular data",
+        "  • The PDF is a scanned image (OCR may be needed)",
+        "  • Tables are in a format not recognized by the extraction tools",
+        "Try using a different PDF or check if it contains actual tables",
+    ),
+    'memory': (
+        "The PDF file is too large or complex to process",
+        "Try processing smaller files or increase available memory",
+    ),
+    'timeout': (
+        "PDF processing timed out - the file may be too complex",
+        "Try processing a simpler PDF file",
+    ),
+    'excel': (
+        "Error generating Excel file",
+        "Check that the output directory is writable",
+        "Ensure the XLSX file is not open in Excel",
+    ),
+    'disk': (
+        "Not enough disk space to write the XLSX file",
+        "Free up disk space or convert into a directory on another drive",
+    ),
+}
+_GENERIC_ERROR_HINT = (
+    "An unexpected error occurred during PDF to XLSX conversion",
+    "Please check:",
+    "  • PDF file integrity",
+    "  • Available disk space",
+    "  • File permissions",
+    "  • Java installation (required for tabula-py)",
+)
+
+# Result of check_xlsx_dependencies, cached so the checks run once per process
+_DEPS_OK: Optional[bool] = None
+
+# False in batch worker processes: the pool already runs one file per CPU, so the
+# fallback tabula strategies run one after another there instead of concurrently
+_concurrent_fallbacks_allowed = True
+
+# Custom document property that records which PDF an XLSX file was generated from
+SOURCE_HASH_PROPERTY = "SourcePdfSha256"
+
+# tabula strategies in priority order: (extraction method, label, read_pdf options, assume_header)
+TABULA_STRATEGIES = (
+    ("tabula-default", "Default", {'pandas_options': {'header': 0}}, True),
+    # Lattice method (for tables with clear borders)
+    ("tabula-lattice", "Lattice", {'lattice': True, 'pandas_options': {'header': 0}}, True),
+    # Stream method (for tables without clear borders)
+    ("tabula-stream", "Stream", {'stream': True, 'pandas_options': {'header': 0}}, True),
+    # Text-based: don't guess table areas and don't assume a header row
+    ("tabula-text", "Text", {'guess': False, 'pandas_options': {'header': None}}, False),
+)
+
 
 @dataclass
 class ConversionResult:
@@ -50,12 +188,16 @@ class TableExtractionResult:
     tables: List[pd.DataFrame]
     error_message: Optional[str] = None
     extraction_method: str = "tabula"
+    source_hash: Optional[str] = None  # SHA-256 of the PDF the tables came from
 
 
+@functools.lru_cache(maxsize=1)
 def check_java_installation() -> tuple[bool, str]:
     """
     Check if Java is installed and accessible
     
+    The result is cached, so `java -version` runs at most once per process.
+    
     Returns:
         Tuple of (is_installed, version_info)
         - is_installed: True if Java is available
@@ -94,6 +236,26 @@ def check_xlsx_dependencies() -> bool:
     """
     Check if all required dependencies for PDF to XLSX conversion are available
     
+    The checks (and their output) run once per process; later calls return the
+    cached result.
+    
+    Returns:
+        True if all dependencies are satisfied, False otherwise
+    """
+    global _DEPS_OK
+    if _DEPS_OK is None:
+        _DEPS_OK = _check_xlsx_dependencies_impl()
+    return _DEPS_OK
+
+
+def _check_xlsx_dependencies_impl() -> bool:
+    """
+    Internal implementation of dependency checking
+    
+    pandas and tabula are only located with importlib.util.find_spec, so the check
+    does not pay for importing them; openpyxl is imported at module load and is
+    looked up in sys.modules.
+    
     Returns:
         True if all dependencies are satisfied, False otherwise
     """
@@ -110,44 +272,63 @@ def check_xlsx_dependencies() -> bool:
         print(f"✅ Java check passed: {java_info}")
     
     # Check tabula-py
-    try:
-        import tabula
+    if importlib.util.find_spec('tabula') is not None:
         print("✅ tabula-py is available")
-    except ImportError:
+    else:
         print("❌ tabula-py is not installed")
-        print("   Please install it using: pip install tabula-py")
+        print("   Please install it using: pip install \"tabula-py[jpype]\"")
         missing_deps.append("tabula-py")
     
-    # Check pandas
+    # Check jpype (optional, keeps one JVM in-process instead of one java subprocess per call)
     try:
-        import pandas as pd
-        print("✅ pandas is available")
+        import jpype
+        print("✅ jpype is available (tabula runs in-process)")
     except ImportError:
+        print("⚠️ jpype is not installed (optional)")
+        print("   tabula will start a new Java process for every extraction attempt")
+        print("   For faster extraction, install it using: pip install \"tabula-py[jpype]\"")
+    
+    # Check pandas
+    if importlib.util.find_spec('pandas') is not None:
+        print("✅ pandas is available")
+    else:
         print("❌ pandas is not installed")
         print("   Please install it using: pip install pandas")
         missing_deps.append("pandas")
     
     # Check openpyxl
-    try:
-        import openpyxl
+    if 'openpyxl' in sys.modules:
         print("✅ openpyxl is available")
-    except ImportError:
+    else:
         print("❌ openpyxl is not installed")
         print("   Please install it using: pip install openpyxl")
         missing_deps.append("openpyxl")
     
+    # Check xlsxwriter (optional, faster XLSX writing)
+    if XLSXWRITER_AVAILABLE:
+        print("✅ xlsxwriter is available (optional fast writer)")
+    else:
+        print("⚠️ xlsxwriter is not installed (optional)")
+        print("   For faster XLSX writing, install it using: pip install xlsxwriter")
+    
     # Check pdfplumber (optional, used as fallback)
-    try:
-        import pdfplumber
+    if PDFPLUMBER_AVAILABLE:
         print("✅ pdfplumber is available (optional fallback)")
-    except ImportError:
+    else:
         print("⚠️ pdfplumber is not installed (optional)")
         print("   For better table extraction, install it using: pip install pdfplumber")
     
+    # Check pypdf (optional, used for the pre-extraction check)
+    if PYPDF_AVAILABLE:
+        print("✅ pypdf is available (optional pre-extraction check)")
+    else:
+        print("⚠️ pypdf is not installed (optional)")
+        print("   To skip empty or password-protected PDFs quickly, install it using: pip install pypdf")
+    
     if missing_deps:
         print(f"\n❌ Missing dependencies: {', '.join(missing_deps)}")
         print("\nTo install all required dependencies, run:")
-        print("pip install tabula-py pandas openpyxl")
+        print("pip install \"tabula-py[jpype]\" pandas openpyxl")
         if "java" in missing_deps:
             print("\nAlso install Java from: https://www.java.com/download/")
         return False
@@ -179,10 +360,23 @@ def generate_xlsx_path(pdf_path: str) -> str:
 
 # Import existing utility functions from the original converter
 # We'll reuse these functions from pdf_converter.py
-def get_pdf_files(directory_path: str) -> List[str]:
+def iter_pdf_files(directory_path: str) -> Iterator[str]:
     """
-    Scan directory and identify PDF files
-    (This will be imported/copied from the existing pdf_converter.py)
+    Yield the paths of PDF files in a directory as the directory is read
+    
+    Entries come back in directory order without sorting, so a caller can start
+    on the first PDF before the rest of a large directory has been listed.
+    
+    Args:
+        directory_path: Directory to scan
+        
+    Yields:
+        Path of each PDF file in the directory
+        
+    Raises:
+        FileNotFoundError: If the directory does not exist
+        NotADirectoryError: If the path is not a directory
+        PermissionError: If the directory cannot be read
     """
     if not os.path.exists(directory_path):
         raise FileNotFoundError(f"Directory not found: {directory_path}")
@@ -191,54 +385,63 @@ def get_pdf_files(directory_path: str) -> List[str]:
         raise NotADirectoryError(f"Path is not a directory: {directory_path}")
     
     try:
-        pdf_files = []
-        for file_name in os.listdir(directory_path):
-            file_path = os.path.join(directory_path, file_name)
-            
-            # Check if it's a file (not a directory) and has .pdf extension
-            if os.path.isfile(file_path) and file_name.lower().endswith('.pdf'):
-                pdf_files.append(file_path)
-        
-        return sorted(pdf_files)  # Return sorted list for consistent ordering
+        # DirEntry.is_file() is answered from the directory listing, avoiding a stat per entry
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith('.pdf') and entry.is_file():
+                    yield entry.path
         
     except PermissionError as e:
         raise PermissionError(f"Permission denied accessing directory: {directory_path}") from e
 
 
+def get_pdf_files(directory_path: str) -> List[str]:
+    """
+    Scan directory and identify PDF files
+    (This will be imported/copied from the existing pdf_converter.py)
+    """
+    return sorted(iter_pdf_files(directory_path))  # Return sorted list for consistent ordering
+
+
 def is_valid_pdf_file(pdf_path: str) -> tuple[bool, str]:
     """
     Check if a file is a valid PDF by examining its structure
-    (Copied from existing pdf_converter.py)
+    
+    Args:
+        pdf_path: Path to the PDF file to validate
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+        - is_valid: True if the file appears to be a valid PDF
+        - error_message: Description of the issue if not valid, empty string if valid
     """
     try:
         with open(pdf_path, 'rb') as f:
-            # Read first 1024 bytes to check PDF structure
-            header = f.read(1024)
+            file_size = os.fstat(f.fileno()).st_size
             
-            # Check for PDF header
-            if not header.startswith(b'%PDF'):
+            # Empty files cannot be memory-mapped and are never valid PDFs
+            if file_size == 0:
                 return False, "File does not have a valid PDF header"
             
-            # Check file size first - empty or very small files are likely invalid
-            f.seek(0, 2)  # Seek to end
-            file_size = f.tell()
-            if file_size < 100:  # PDF files should be at least 100 bytes
-                return False, "File is too small to be a valid PDF"
-            
-            # Check for basic PDF structure markers
-            if b'obj' not in header and b'endobj' not in header:
-                # Read more of the file to look for object markers
-                f.seek(0)
-                content = f.read(4096)
-                if b'obj' not in content:
+            # Map the file once and search it in place instead of reading into buffers
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Check for PDF header
+                if mm[:4] != b'%PDF':
+                    return False, "File does not have a valid PDF header"
+                
+                # Empty or very small files are likely invalid
+                if file_size < 100:  # PDF files should be at least 100 bytes
+                    return False, "File is too small to be a valid PDF"
+                
+                # Look for EOF marker near the end of file; scanning backwards over just
+                # the last 1 KB only pages in the tail, however large the file is
+                if mm.rfind(b'%%EOF', max(0, file_size - 1024)) == -1:
+                    return False, "File does not have a valid PDF end marker"
+                
+                # Check for basic PDF structure markers ('endobj' contains 'obj')
+                if mm.find(b'obj', 0, min(file_size, 4096)) == -1:
                     return False, "File does not contain valid PDF object structure"
             
-            # Look for EOF marker near the end of file
-            f.seek(max(0, file_size - 1024))
-            tail = f.read()
-            if b'%%EOF' not in tail:
-                return False, "File does not have a valid PDF end marker"
-            
         return True, ""
         
     except Exception as e:
@@ -252,18 +455,248 @@ def check_file_exists(file_path: str) -> bool:
     return os.path.exists(file_path) and os.path.isfile(file_path)
 
 
-def extract_tables_from_pdf(pdf_path: str) -> TableExtractionResult:
+def list_existing_xlsx(directory_path: str) -> Set[str]:
     """
-    Extract all tables from a PDF file using tabula-py with multiple strategies
+    Collect the lower-cased names of the XLSX files in a directory in one scan
+    
+    Names are lower-cased so lookups also hold on case-insensitive file systems,
+    where "Report.XLSX" would be overwritten by a new "Report.xlsx".
+    
+    Args:
+        directory_path: Directory to scan
+        
+    Returns:
+        Set of lower-cased XLSX file names
+    """
+    with os.scandir(directory_path) as entries:
+        return {
+            entry.name.lower() for entry in entries
+            if entry.name.lower().endswith('.xlsx') and entry.is_file()
+        }
+
+
+def _import_table_libraries() -> None:
+    """
+    Import pandas and tabula on first use and keep them as module globals
+    
+    Called at the top of every function that uses pd or tabula at run time; later
+    calls return immediately.
+    """
+    global pd, tabula
+    if tabula is None:
+        import pandas as pd
+        import tabula
+
+
+def _tabula_strategy_tables(strategy: tuple, read_tables) -> List[pd.DataFrame]:
+    """
+    Get the cleaned tables found by one tabula strategy
+    
+    Cleaning runs inside the same try as extraction, so a table that fails to clean
+    falls through to the next strategy instead of failing the whole file.
+    
+    Args:
+        strategy: Entry of TABULA_STRATEGIES
+        read_tables: Callable returning the strategy's raw tabula tables
+        
+    Returns:
+        Valid cleaned tables, or an empty list if the strategy failed or found none
+    """
+    _, label, _, assume_header = strategy
+    try:
+        tables = read_tables()
+        return process_extracted_tables(tables, assume_header=assume_header) if tables else []
+    except Exception as e:
+        print(f"  ⚠️ {label} extraction failed: {e}")
+        return []
+
+
+def _read_pdf_tables(pdf_path: str, **options) -> List[pd.DataFrame]:
+    """
+    Run tabula on every page of a PDF with the in-process JVM when available
+    
+    With the jpype extra installed (pip install "tabula-py[jpype]") tabula keeps a
+    single JVM resident in this process, so the extraction strategies don't each
+    pay for starting a new java subprocess. Without jpype tabula falls back to the
+    subprocess backend on its own.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        **options: Extra keyword arguments for tabula.read_pdf (strategy settings)
+        
+    Returns:
+        List of DataFrames found by tabula
+    """
+    _import_table_libraries()
+    return tabula.read_pdf(
+        pdf_path,
+        pages='all',
+        multiple_tables=True,
+        force_subprocess=False,
+        **options
+    )
+
+
+def shutdown_jvm() -> None:
+    """
+    Shut down the JVM that tabula started in this process, if there is one
+    
+    jpype only starts the JVM once per process, so it stays resident across all
+    extractions; this releases it explicitly at the end of a run. jpype is only
+    imported by tabula (or the dependency check), so it is looked up in sys.modules.
+    """
+    jpype = sys.modules.get('jpype')
+    if jpype is not None and jpype.isJVMStarted():
+        jpype.shutdownJVM()
+
+
+def _init_batch_worker() -> None:
+    """
+    Set up a batch worker process for tabula extraction
+    
+    The pool already runs one file per CPU, so fallback tabula strategies run one
+    after another in a worker; running them concurrently could start three JVMs per
+    worker (each with the default heap) when jpype is not installed.
+    
+    tabula only runs in the pool workers, so each worker owns the JVM it started.
+    A multiprocessing finalizer shuts it down on worker exit for both fork and spawn
+    start methods, unlike atexit handlers, which forked workers skip.
+    """
+    global _concurrent_fallbacks_allowed
+    _concurrent_fallbacks_allowed = False
+    multiprocessing.util.Finalize(None, shutdown_jvm, exitpriority=10)
+
+
+def compute_pdf_hash(pdf_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents
+    
+    Args:
+        pdf_path: Path to the file
+        
+    Returns:
+        Hex digest of the file contents
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(pdf_path, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        
+        # Hash the mapped file directly; pages are read on demand, never copied into Python
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def _table_cache_path(pdf_hash: str) -> str:
+    """
+    Get the cache file path for a PDF content hash
+    
+    Args:
+        pdf_hash: SHA-256 hex digest of the PDF contents
+        
+    Returns:
+        Path of the pickled TableExtractionResult for that hash
+    """
+    return os.path.join(TABLE_CACHE_DIR, f"{pdf_hash}.v{TABLE_CACHE_VERSION}.pkl")
+
+
+def load_cached_tables(pdf_hash: str) -> Optional[TableExtractionResult]:
+    """
+    Load a previously cached extraction result
+    
+    Args:
+        pdf_hash: SHA-256 hex digest of the PDF contents
+        
+    Returns:
+        The cached TableExtractionResult, or None if there is no usable entry
+    """
+    try:
+        with open(_table_cache_path(pdf_hash), 'rb') as f:
+            result = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # A truncated or incompatible entry is treated as a cache miss
+        return None
+    
+    return result if isinstance(result, TableExtractionResult) else None
+
+
+def store_cached_tables(pdf_hash: str, result: TableExtractionResult) -> None:
+    """
+    Cache a successful extraction result for later runs
+    
+    Caching is best effort; failures to write the cache never fail a conversion.
+    
+    Args:
+        pdf_hash: SHA-256 hex digest of the PDF contents
+        result: Successful extraction result to cache
+    """
+    cache_path = _table_cache_path(pdf_hash)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    
+    try:
+        os.makedirs(TABLE_CACHE_DIR, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic rename so parallel workers never see a half-written entry
+        os.replace(temp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def preflight_pdf(pdf_path: str) -> tuple[bool, str]:
+    """
+    Check with pypdf that a PDF has pages tabula could read, before starting Java
+    
+    Only definite problems are reported: a document with no pages, or one that
+    cannot be opened without a password. If pypdf is not installed or cannot parse
+    the file, the PDF is passed on, since tabula's parser may still handle it.
+    
+    Args:
+        pdf_path: Path to a PDF file that passed is_valid_pdf_file
+        
+    Returns:
+        Tuple of (is_usable, error_message)
+    """
+    if not PYPDF_AVAILABLE:
+        return True, ""
+    
+    try:
+        reader = pypdf.PdfReader(pdf_path, strict=False)
+        if reader.is_encrypted and reader.decrypt("") == pypdf.PasswordType.NOT_DECRYPTED:
+            return False, "PDF is password-protected"
+        if len(reader.pages) == 0:
+            return False, "PDF has no pages"
+    except Exception:
+        return True, ""  # Leave the verdict to the extractors
+    
+    return True, ""
+
+
+def extract_tables_from_pdf(pdf_path: str, validated: bool = False) -> TableExtractionResult:
+    """
+    Extract all tables from a PDF file, reusing cached results for unchanged PDFs
+    
+    Successful extractions are cached by the SHA-256 of the PDF contents, so a
+    byte-identical PDF is never run through the extraction strategies twice.
     
     Args:
         pdf_path: Path to the input PDF file
+        validated: True if the caller has already checked the file with
+            is_valid_pdf_file, so the check is not repeated
         
     Returns:
         TableExtractionResult containing extracted tables or error information
     """
-    try:
-        # Validate PDF file first
+    # Validate PDF file first
+    if not validated:
         is_valid, error_msg = is_valid_pdf_file(pdf_path)
         if not is_valid:
             return TableExtractionResult(
@@ -272,106 +705,107 @@ def extract_tables_from_pdf(pdf_path: str) -> TableExtractionResult:
                 error_message=f"Invalid PDF file: {error_msg}",
                 extraction_method="validation"
             )
+    
+    try:
+        pdf_hash = compute_pdf_hash(pdf_path)
+    except OSError:
+        pdf_hash = None  # Unreadable here; let the extractors report the error
+    
+    if pdf_hash:
+        cached = load_cached_tables(pdf_hash)
+        if cached is not None:
+            print(f"♻️  Using cached tables for: {os.path.basename(pdf_path)}")
+            cached.source_hash = pdf_hash
+            return cached
+    
+    # Reject PDFs that cannot contain tables before paying for a JVM start
+    is_usable, error_msg = preflight_pdf(pdf_path)
+    if not is_usable:
+        return TableExtractionResult(
+            success=False,
+            tables=[],
+            error_message=f"Invalid PDF file: {error_msg}",
+            extraction_method="preflight"
+        )
+    
+    result = _extract_tables_uncached(pdf_path)
+    result.source_hash = pdf_hash
+    
+    if pdf_hash and result.success:
+        store_cached_tables(pdf_hash, result)
+    
+    return result
+
+
+def _extract_tables_uncached(pdf_path: str) -> TableExtractionResult:
+    """
+    Extract all tables from a PDF file using tabula-py with multiple strategies
+    
+    The default tabula strategy runs alone first, since it finds the tables in most
+    PDFs. Only if it comes up empty do the other tabula strategies run, concurrently;
+    their results are still checked in priority order, so the chosen strategy is the
+    same as with sequential fallback.
+    
+    Args:
+        pdf_path: Path to the input PDF file (already validated)
         
+    Returns:
+        TableExtractionResult containing extracted tables or error information
+    """
+    try:
         print(f"🔍 Extracting tables from: {os.path.basename(pdf_path)}")
         
-        # Strategy 1: Try with default settings
-        try:
-            print("  📋 Trying default table extraction...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                pandas_options={'header': 0}
-            )
-            
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
-                if valid_tables:
-                    return TableExtractionResult(
-                        success=True,
-                        tables=valid_tables,
-                        error_message=None,
-                        extraction_method="tabula-default"
-                    )
-        except Exception as e:
-            print(f"  ⚠️ Default extraction failed: {e}")
-        
-        # Strategy 2: Try with lattice method (for tables with clear borders)
-        try:
-            print("  📋 Trying lattice method...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                lattice=True,
-                pandas_options={'header': 0}
-            )
-            
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
-                if valid_tables:
-                    return TableExtractionResult(
-                        success=True,
-                        tables=valid_tables,
-                        error_message=None,
-                        extraction_method="tabula-lattice"
-                    )
-        except Exception as e:
-            print(f"  ⚠️ Lattice extraction failed: {e}")
-        
-        # Strategy 3: Try with stream method (for tables without clear borders)
-        try:
-            print("  📋 Trying stream method...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                stream=True,
-                pandas_options={'header': 0}
+        # Strategy 1: default tabula extraction, on its own
+        default_strategy, fallback_strategies = TABULA_STRATEGIES[0], TABULA_STRATEGIES[1:]
+        print("  📋 Trying default tabula extraction...")
+        valid_tables = _tabula_strategy_tables(
+            default_strategy, functools.partial(_read_pdf_tables, pdf_path, **default_strategy[2])
+        )
+        if valid_tables:
+            return TableExtractionResult(
+                success=True,
+                tables=valid_tables,
+                error_message=None,
+                extraction_method=default_strategy[0]
             )
-            
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
-                if valid_tables:
-                    return TableExtractionResult(
-                        success=True,
-                        tables=valid_tables,
-                        error_message=None,
-                        extraction_method="tabula-stream"
-                    )
-        except Exception as e:
-            print(f"  ⚠️ Stream extraction failed: {e}")
         
-        # Strategy 4: Try to extract as raw text and structure it
-        try:
-            print("  📋 Trying text-based extraction...")
-            # This is a fallback - extract all text and try to structure it
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                guess=False,  # Don't guess table areas
-                pandas_options={'header': None}  # No header assumption
-            )
-            
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables, assume_header=False)
+        # Strategies 2-4: lattice, stream and text-based tabula extraction. Run
+        # concurrently, leaving the with block waits for all of them, so a losing
+        # strategy never keeps running (and holding the JVM) into the next file.
+        # Batch workers run them one after another and stop at the first success.
+        if _concurrent_fallbacks_allowed:
+            print(f"  📋 Running {len(fallback_strategies)} fallback tabula strategies concurrently...")
+            executor = ThreadPoolExecutor(max_workers=len(fallback_strategies))
+            readers = [
+                executor.submit(_read_pdf_tables, pdf_path, **options).result
+                for _, _, options, _ in fallback_strategies
+            ]
+        else:
+            print(f"  📋 Trying {len(fallback_strategies)} fallback tabula strategies...")
+            executor = contextlib.nullcontext()
+            readers = [
+                functools.partial(_read_pdf_tables, pdf_path, **options)
+                for _, _, options, _ in fallback_strategies
+            ]
+        
+        with executor:
+            for read_tables, strategy in zip(readers, fallback_strategies):
+                valid_tables = _tabula_strategy_tables(strategy, read_tables)
                 if valid_tables:
                     return TableExtractionResult(
                         success=True,
                         tables=valid_tables,
                         error_message=None,
-                        extraction_method="tabula-text"
+                        extraction_method=strategy[0]
                     )
-        except Exception as e:
-            print(f"  ⚠️ Text extraction failed: {e}")
         
         # Strategy 5: Try pdfplumber as final fallback (if available)
         if PDFPLUMBER_AVAILABLE:
             try:
                 print("  📋 Trying pdfplumber as fallback...")
-                tables = extract_with_pdfplumber(pdf_path)
+                with pdfplumber.open(pdf_path) as pdf:
+                    # A document without pages has nothing to extract
+                    tables = extract_with_pdfplumber(pdf) if pdf.pages else []
                 
                 if tables and len(tables) > 0:
                     valid_tables = process_extracted_tables(tables, assume_header=False)
@@ -443,207 +877,358 @@ def process_extracted_tables(tables: List[pd.DataFrame], assume_header: bool = T
     return valid_tables
 
 
-def extract_with_pdfplumber(pdf_path: str) -> List[pd.DataFrame]:
+def extract_with_pdfplumber(pdf) -> List[pd.DataFrame]:
     """
     Extract tables using pdfplumber as a fallback method
     
+    Takes a document the caller has already opened with pdfplumber.open(), so the
+    PDF is parsed once however many pdfplumber passes use it.
+    
     Args:
-        pdf_path: Path to the PDF file
+        pdf: Open pdfplumber PDF document
         
     Returns:
         List of DataFrames extracted from the PDF
     """
-    if not PDFPLUMBER_AVAILABLE:
-        return []
+    _import_table_libraries()
     
     tables = []
     
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                # Try to extract tables from the page
-                page_tables = page.extract_tables()
-                
-                if page_tables:
-                    for table_data in page_tables:
-                        if table_data and len(table_data) > 1:  # At least 2 rows
-                            # Convert to DataFrame
-                            df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                            
-                            # Clean the DataFrame
-                            df = df.dropna(how='all')  # Remove empty rows
-                            df = df.dropna(axis=1, how='all')  # Remove empty columns
-                            
-                            if not df.empty:
-                                tables.append(df)
-                
-                # If no tables found, try to extract text and structure it
-                if not page_tables:
-                    text = page.extract_text()
-                    if text:
-                        # Try to find table-like structures in text
-                        lines = text.split('\n')
-                        table_lines = []
-                        
-                        for line in lines:
-                            # Look for lines that might be table rows (contain multiple spaces or tabs)
-                            if '\t' in line or '  ' in line:
-                                # Split by tabs or multiple spaces
-                                if '\t' in line:
-                                    cells = line.split('\t')
-                                else:
-                                    cells = [cell.strip() for cell in line.split('  ') if cell.strip()]
-                                
-                                if len(cells) > 1:  # At least 2 columns
-                                    table_lines.append(cells)
-                        
-                        # If we found table-like lines, create a DataFrame
-                        if len(table_lines) > 1:
-                            # Find the maximum number of columns
-                            max_cols = max(len(row) for row in table_lines)
-                            
-                            # Pad rows to have the same number of columns
-                            padded_lines = []
-                            for row in table_lines:
-                                padded_row = row + [''] * (max_cols - len(row))
-                                padded_lines.append(padded_row)
-                            
-                            # Create DataFrame
-                            if padded_lines:
-                                df = pd.DataFrame(padded_lines[1:], columns=padded_lines[0])
-                                df = df.dropna(how='all')
-                                
-                                if not df.empty:
-                                    tables.append(df)
+    try:
+        for page_num, page in enumerate(pdf.pages):
+            # Try to extract tables from the page
+            page_tables = page.extract_tables()
+            
+            if page_tables:
+                for table_data in page_tables:
+                    if table_data and len(table_data) > 1:  # At least 2 rows
+                        # Convert to DataFrame
+                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                        
+                        # Clean the DataFrame
+                        df = df.dropna(how='all')  # Remove empty rows
+                        df = df.dropna(axis=1, how='all')  # Remove empty columns
+                        
+                        if not df.empty:
+                            tables.append(df)
+            
+            # If no tables found, try to extract text and structure it
+            if not page_tables:
+                text = page.extract_text()
+                if text:
+                    # Try to find table-like structures in text
+                    lines = text.split('\n')
+                    table_lines = []
+                    
+                    for line in lines:
+                        # Lines that might be table rows split on tabs or runs of 2+ spaces
+                        cells = _CELL_SEPARATOR_RE.split(line.strip())
+                        if len(cells) > 1:  # At least 2 columns
+                            table_lines.append(cells)
+                    
+                    # If we found table-like lines, create a DataFrame
+                    if len(table_lines) > 1:
+                        # The DataFrame constructor pads short rows; fill the gaps with ''
+                        padded = pd.DataFrame(table_lines).fillna('')
+                        df = pd.DataFrame(padded.values[1:], columns=padded.values[0])
+                        df = df.dropna(how='all')
+                        
+                        if not df.empty:
+                            tables.append(df)
+    
+    except Exception as e:
+        print(f"  ⚠️ pdfplumber processing error: {e}")
+    
+    return tables
+
+
+def save_tables_to_xlsx(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str = "",
+                        source_hash: Optional[str] = None) -> None:
+    """
+    Save extracted tables to an XLSX file with proper formatting
+    
+    Uses xlsxwriter in constant-memory mode when it is installed, falling back to
+    openpyxl otherwise. Both writers produce the same sheets and formatting.
+    
+    Args:
+        tables: List of DataFrames containing table data
+        xlsx_path: Path where the XLSX file should be saved
+        source_pdf: Name of the source PDF file (for metadata)
+        source_hash: SHA-256 of the source PDF, stored as a custom document
+            property so later runs can tell whether the output is up to date
+        
+    Raises:
+        PermissionError: If file cannot be written due to permissions
+        OSError: If there are disk space or other system issues
+        Exception: For other Excel generation errors
+    """
+    try:
+        if XLSXWRITER_AVAILABLE:
+            _write_tables_with_xlsxwriter(tables, xlsx_path, source_pdf, source_hash)
+        else:
+            _write_tables_with_openpyxl(tables, xlsx_path, source_pdf, source_hash)
+        print(f"  💾 Saved XLSX file: {os.path.basename(xlsx_path)}")
+        
+    except PermissionError as e:
+        raise PermissionError(f"Permission denied writing XLSX file: {xlsx_path} - {e}")
+    except OSError as e:
+        if "space" in str(e).lower() or "disk" in str(e).lower():
+            raise OSError(f"Insufficient disk space to save XLSX file: {xlsx_path}")
+        else:
+            raise OSError(f"System error saving XLSX file: {xlsx_path} - {e}")
+    except Exception as e:
+        raise Exception(f"Failed to create XLSX file: {e}")
+
+
+def _table_sheet_name(index: int, table_count: int) -> str:
+    """
+    Get the worksheet name for a table
+    
+    Args:
+        index: Zero-based position of the table
+        table_count: Total number of tables in the workbook
+        
+    Returns:
+        Valid Excel sheet name
+    """
+    # Create worksheet name
+    if table_count == 1:
+        sheet_name = "Table"
+    else:
+        sheet_name = f"Table_{index+1}"
+    
+    # Ensure sheet name is valid (Excel has limitations)
+    return clean_sheet_name(sheet_name)
+
+
+def _column_widths(table: pd.DataFrame) -> List[int]:
+    """
+    Compute Excel column widths from the longest value in each column
+    
+    Args:
+        table: DataFrame about to be written (header row included in the measurement)
+        
+    Returns:
+        One width per column, padded by 2 and limited to the 10-50 range
+    """
+    header_lengths = [len(str(col)) for col in table.columns]
+    body_lengths = table.astype(str).apply(lambda column: column.str.len().max()).to_numpy()
+    
+    # Set column width with reasonable limits
+    return [
+        min(max(max(header_length, body_length) + 2, 10), 50)
+        for header_length, body_length in zip(header_lengths, body_lengths)
+    ]
+
+
+def _write_tables_with_xlsxwriter(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str,
+                                  source_hash: Optional[str]) -> None:
+    """
+    Write tables with xlsxwriter, streaming rows to disk in constant-memory mode
+    
+    Args:
+        tables: List of DataFrames containing table data
+        xlsx_path: Path where the XLSX file should be saved
+        source_pdf: Name of the source PDF file (for metadata)
+        source_hash: SHA-256 of the source PDF, or None
+    """
+    wb = xlsxwriter.Workbook(xlsx_path, {'constant_memory': True})
+    
+    # Formats are created once per workbook and shared by every cell
+    header_format = wb.add_format({
+        'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+        'border': 1, 'align': 'center', 'valign': 'vcenter'
+    })
+    body_format = wb.add_format({'border': 1})
+    percent_format = wb.add_format({'border': 1, 'num_format': '0.0%'})
+    
+    # Process each table
+    sheet_count = 0
+    for i, table in enumerate(tables):
+        if table.empty:
+            continue
+        
+        ws = wb.add_worksheet(_table_sheet_name(i, len(tables)))
+        sheet_count += 1
+        
+        # Convert numeric strings to numbers for better Excel compatibility
+        typed_table, percent_frame = coerce_numeric_cells(table)
+        typed_table = typed_table.astype(object).where(typed_table.notna(), None)
+        percent_cells = percent_frame.to_numpy()
+        
+        ws.write_row(0, 0, [str(col) for col in typed_table.columns], header_format)
+        
+        # Add metadata as a comment
+        if source_pdf:
+            ws.write_comment(0, 0, f"Extracted from: {source_pdf}", {'author': 'PDF Converter'})
+        
+        for r_idx, row in enumerate(typed_table.itertuples(index=False, name=None), 1):
+            if not percent_cells[r_idx - 1].any():
+                ws.write_row(r_idx, 0, row, body_format)
+                continue
+            for c_idx, value in enumerate(row):
+                ws.write(r_idx, c_idx, value, percent_format if percent_cells[r_idx - 1, c_idx] else body_format)
+        
+        # Auto-adjust column widths
+        for c_idx, width in enumerate(_column_widths(typed_table)):
+            ws.set_column(c_idx, c_idx, width)
+    
+    # If no valid tables were processed, create an info sheet
+    if sheet_count == 0:
+        ws = wb.add_worksheet("Info")
+        ws.write(0, 0, "No valid tables found in the PDF file")
+        ws.write(1, 0, f"Source: {source_pdf}" if source_pdf else "Source: Unknown")
     
-    except Exception as e:
-        print(f"  ⚠️ pdfplumber processing error: {e}")
+    # Record the source PDF's content hash for up-to-date checks on later runs
+    if source_hash:
+        wb.set_custom_property(SOURCE_HASH_PROPERTY, source_hash)
     
-    return tables
+    try:
+        wb.close()
+    except xlsxwriter.exceptions.FileCreateError as e:
+        # Surface the underlying OS error so it is reported like the openpyxl path
+        if e.args and isinstance(e.args[0], OSError):
+            raise e.args[0] from e
+        raise
 
 
-def save_tables_to_xlsx(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str = "") -> None:
+def _write_tables_with_openpyxl(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str,
+                                source_hash: Optional[str]) -> None:
     """
-    Save extracted tables to an XLSX file with proper formatting
+    Write tables with openpyxl (used when xlsxwriter is not installed)
     
     Args:
         tables: List of DataFrames containing table data
         xlsx_path: Path where the XLSX file should be saved
         source_pdf: Name of the source PDF file (for metadata)
+        source_hash: SHA-256 of the source PDF, or None
+    """
+    # Create a new workbook
+    wb = Workbook()
+    
+    # Remove the default sheet
+    wb.remove(wb.active)
+    
+    # Define styles for formatting
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    center_alignment = Alignment(horizontal='center', vertical='center')
+    
+    # Register the styles once on the workbook so cells share them by name
+    wb.add_named_style(NamedStyle(
+        name='header', font=header_font, fill=header_fill, border=border, alignment=center_alignment
+    ))
+    wb.add_named_style(NamedStyle(name='body', border=border))
+    
+    # Process each table
+    for i, table in enumerate(tables):
+        if table.empty:
+            continue
+            
+        # Create worksheet
+        ws = wb.create_sheet(title=_table_sheet_name(i, len(tables)))
+        
+        # Convert numeric strings to numbers for better Excel compatibility
+        typed_table, percent_frame = coerce_numeric_cells(table)
+        percent_cells = percent_frame.to_numpy()
+        
+        # Add table data to worksheet through openpyxl's bulk row path
+        for row in dataframe_to_rows(typed_table, index=False, header=True):
+            ws.append(row)
+        
+        # Apply header formatting to first row and bordered body style elsewhere
+        for r_idx, row_cells in enumerate(ws.iter_rows()):
+            for c_idx, cell in enumerate(row_cells):
+                if r_idx == 0:
+                    cell.style = 'header'
+                else:
+                    cell.style = 'body'
+                    if percent_cells[r_idx - 1, c_idx]:
+                        cell.number_format = '0.0%'
         
-    Raises:
-        PermissionError: If file cannot be written due to permissions
-        OSError: If there are disk space or other system issues
-        Exception: For other Excel generation errors
+        # Auto-adjust column widths
+        for c_idx, width in enumerate(_column_widths(typed_table), 1):
+            ws.column_dimensions[get_column_letter(c_idx)].width = width
+        
+        # Add metadata as a comment or separate info
+        if source_pdf:
+            try:
+                from openpyxl.comments import Comment
+                ws['A1'].comment = Comment(f"Extracted from: {source_pdf}", "PDF Converter")
+            except:
+                # If comment creation fails, just skip it
+                pass
+    
+    # If no valid tables were processed, create an info sheet
+    if len(wb.worksheets) == 0:
+        ws = wb.create_sheet(title="Info")
+        ws['A1'] = "No valid tables found in the PDF file"
+        ws['A2'] = f"Source: {source_pdf}" if source_pdf else "Source: Unknown"
+    
+    # Record the source PDF's content hash for up-to-date checks on later runs
+    if source_hash:
+        wb.custom_doc_props.append(StringProperty(name=SOURCE_HASH_PROPERTY, value=source_hash))
+    
+    # Save the workbook
+    wb.save(xlsx_path)
+
+
+def coerce_numeric_cells(table: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
-    try:
-        # Create a new workbook
-        wb = Workbook()
-        
-        # Remove the default sheet
-        wb.remove(wb.active)
-        
-        # Define styles for formatting
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        center_alignment = Alignment(horizontal='center', vertical='center')
+    Convert numeric-looking text cells to numbers, one column at a time
+    
+    Cells made only of digits, '.', '-', ',' and '%' (with at least one digit) are
+    parsed with pandas' vectorized to_numeric: thousands separators are dropped and
+    percentages are divided by 100. Cells that don't parse keep their original value.
+    
+    Args:
+        table: DataFrame of extracted table data
         
-        # Process each table
-        for i, table in enumerate(tables):
-            if table.empty:
-                continue
-                
-            # Create worksheet name
-            if len(tables) == 1:
-                sheet_name = "Table"
-            else:
-                sheet_name = f"Table_{i+1}"
-            
-            # Ensure sheet name is valid (Excel has limitations)
-            sheet_name = clean_sheet_name(sheet_name)
-            
-            # Create worksheet
-            ws = wb.create_sheet(title=sheet_name)
-            
-            # Add table data to worksheet
-            for r_idx, row in enumerate(dataframe_to_rows(table, index=False, header=True)):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx + 1, column=c_idx, value=value)
-                    
-                    # Apply border to all cells
-                    cell.border = border
-                    
-                    # Apply header formatting to first row
-                    if r_idx == 0:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = center_alignment
-                    
-                    # Convert numeric strings to numbers for better Excel compatibility
-                    if r_idx > 0 and isinstance(value, str) and value.strip():
-                        try:
-                            # Try to convert to float if it looks like a number
-                            if value.replace('.', '').replace('-', '').replace('%', '').replace(',', '').isdigit():
-                                if '%' in value:
-                                    cell.value = float(value.replace('%', '')) / 100
-                                    cell.number_format = '0.0%'
-                                elif ',' in value:
-                                    cell.value = float(value.replace(',', ''))
-                                else:
-                                    cell.value = float(value)
-                        except (ValueError, AttributeError):
-                            pass  # Keep as string if conversion fails
-            
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # Set column width with reasonable limits
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
-            # Add metadata as a comment or separate info
-            if source_pdf:
-                try:
-                    from openpyxl.comments import Comment
-                    ws['A1'].comment = Comment(f"Extracted from: {source_pdf}", "PDF Converter")
-                except:
-                    # If comment creation fails, just skip it
-                    pass
-        
-        # If no valid tables were processed, create an info sheet
-        if len(wb.worksheets) == 0:
-            ws = wb.create_sheet(title="Info")
-            ws['A1'] = "No valid tables found in the PDF file"
-            ws['A2'] = f"Source: {source_pdf}" if source_pdf else "Source: Unknown"
-        
-        # Save the workbook
-        wb.save(xlsx_path)
-        print(f"  💾 Saved XLSX file: {os.path.basename(xlsx_path)}")
+    Returns:
+        Tuple of (typed_table, percent_cells)
+        - typed_table: Copy of the table with numeric strings converted to floats
+        - percent_cells: Boolean DataFrame marking cells converted from percentages
+    """
+    _import_table_libraries()
+    
+    typed_columns = []
+    percent_columns = []
+    
+    for c_idx in range(table.shape[1]):
+        column = table.iloc[:, c_idx]
         
-    except PermissionError as e:
-        raise PermissionError(f"Permission denied writing XLSX file: {xlsx_path} - {e}")
-    except OSError as e:
-        if "space" in str(e).lower() or "disk" in str(e).lower():
-            raise OSError(f"Insufficient disk space to save XLSX file: {xlsx_path}")
-        else:
-            raise OSError(f"System error saving XLSX file: {xlsx_path} - {e}")
-    except Exception as e:
-        raise Exception(f"Failed to create XLSX file: {e}")
+        # Numeric dtypes are already written as numbers
+        if not pd.api.types.is_object_dtype(column) and not pd.api.types.is_string_dtype(column):
+            typed_columns.append(column)
+            percent_columns.append(pd.Series(False, index=column.index))
+            continue
+        
+        text = column.astype(str)
+        looks_numeric = text.str.fullmatch(_NUMERIC_TEXT_RE)
+        is_percent = looks_numeric & text.str.contains('%', regex=False)
+        
+        # Percentages only drop the sign; other numbers only drop thousands separators
+        stripped = text.str.replace('%', '', regex=False).where(
+            is_percent, text.str.replace(',', '', regex=False)
+        )
+        numbers = pd.to_numeric(stripped.where(looks_numeric), errors='coerce')
+        numbers = numbers.where(~is_percent, numbers / 100)
+        converted = numbers.notna()
+        
+        typed_columns.append(column.astype(object).where(~converted, numbers))
+        percent_columns.append(is_percent & converted)
+    
+    typed_table = pd.concat(typed_columns, axis=1) if typed_columns else table.copy()
+    typed_table.columns = table.columns
+    percent_cells = pd.concat(percent_columns, axis=1) if percent_columns else pd.DataFrame(index=table.index)
+    
+    return typed_table, percent_cells
 
 
 def clean_sheet_name(name: str) -> str:
@@ -695,9 +1280,12 @@ def validate_xlsx_output(xlsx_path: str) -> bool:
         if file_size < 1000:  # XLSX files should be at least 1KB
             return False
         
-        # Try to open the file with pandas to verify it's readable
-        pd.read_excel(xlsx_path, sheet_name=0, nrows=1)
-        return True
+        # Open the workbook in read-only mode (no style parsing or cell loading)
+        wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            return len(wb.sheetnames) > 0
+        finally:
+            wb.close()
         
     except Exception:
         return False
@@ -738,21 +1326,16 @@ def convert_pdf_to_xlsx(pdf_path: str, xlsx_path: str) -> bool:
         if output_dir and not os.path.exists(output_dir):
             raise FileNotFoundError(f"Output directory does not exist: {output_dir}")
         
-        # Test write permissions
-        try:
-            temp_file = xlsx_path + ".tmp"
-            with open(temp_file, 'w') as f:
-                f.write("test")
-            os.remove(temp_file)
-        except PermissionError:
+        # Check write permission on the output directory without touching the disk;
+        # save_tables_to_xlsx still reports any failure of the actual write
+        if not os.access(output_dir or os.path.dirname(os.path.abspath(xlsx_path)), os.W_OK):
             raise PermissionError(f"Permission denied writing to output location: {xlsx_path}")
-        except OSError as e:
-            raise OSError(f"Cannot write to output location: {xlsx_path} - {e}")
         
         print(f"🔄 Converting: {os.path.basename(pdf_path)} → {os.path.basename(xlsx_path)}")
         
         # Extract tables from PDF
-        extraction_result = extract_tables_from_pdf(pdf_path)
+        # The PDF was validated above, so extraction doesn't scan it again
+        extraction_result = extract_tables_from_pdf(pdf_path, validated=True)
         
         if not extraction_result.success:
             raise Exception(f"Table extraction failed: {extraction_result.error_message}")
@@ -764,7 +1347,8 @@ def convert_pdf_to_xlsx(pdf_path: str, xlsx_path: str) -> bool:
         save_tables_to_xlsx(
             extraction_result.tables, 
             xlsx_path, 
-            os.path.basename(pdf_path)
+            os.path.basename(pdf_path),
+            extraction_result.source_hash
         )
         
         # Validate the output file
@@ -789,19 +1373,152 @@ def convert_pdf_to_xlsx(pdf_path: str, xlsx_path: str) -> bool:
         raise e
 
 
-def should_convert_file(pdf_path: str, xlsx_path: str) -> bool:
+def read_source_hash(xlsx_path: str) -> Optional[str]:
+    """
+    Read the source PDF hash recorded in an XLSX file by save_tables_to_xlsx
+    
+    Args:
+        xlsx_path: Path to the XLSX file
+        
+    Returns:
+        The recorded SHA-256 hex digest, or None if the file has none or can't be read
+    """
+    try:
+        wb = load_workbook(xlsx_path, read_only=True)
+    except Exception:
+        return None
+    
+    try:
+        for prop in wb.custom_doc_props:
+            if prop.name == SOURCE_HASH_PROPERTY:
+                return prop.value
+        return None
+    finally:
+        wb.close()
+
+
+def load_conversion_manifest(directory: str) -> Dict[str, dict]:
+    """
+    Load the record of XLSX files previously generated in a directory
+    
+    Args:
+        directory: Directory containing the PDF and XLSX files
+        
+    Returns:
+        Mapping of XLSX file name to {"sha256": source hash, "mtime": XLSX mtime};
+        empty if the manifest is missing or unreadable
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_conversion_manifest(directory: str, manifest: Dict[str, dict]) -> None:
+    """
+    Save the record of generated XLSX files (best effort)
+    
+    Args:
+        directory: Directory containing the PDF and XLSX files
+        manifest: Mapping as returned by load_conversion_manifest
+    """
+    manifest_path = os.path.join(directory, MANIFEST_FILE_NAME)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_path, manifest_path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def record_conversion(manifest: Dict[str, dict], xlsx_path: str) -> None:
+    """
+    Add a freshly generated XLSX file to the manifest
+    
+    Args:
+        manifest: Mapping as returned by load_conversion_manifest
+        xlsx_path: Path of the XLSX file that was just written
+    """
+    source_hash = read_source_hash(xlsx_path)
+    if not source_hash:
+        return
+    
+    try:
+        xlsx_mtime = os.stat(xlsx_path).st_mtime
+    except OSError:
+        return
+    
+    manifest[os.path.basename(xlsx_path)] = {'sha256': source_hash, 'mtime': xlsx_mtime}
+
+
+def is_xlsx_up_to_date(pdf_path: str, xlsx_path: str, manifest: Optional[Dict[str, dict]] = None) -> bool:
+    """
+    Check whether an existing XLSX was generated from the current PDF contents
+    
+    The cheap mtime comparison runs first; the PDF is only hashed when the XLSX is
+    newer, which catches PDFs that were replaced with their timestamps preserved.
+    XLSX files without a recorded source hash are never considered up to date.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        xlsx_path: Path of the existing XLSX file
+        manifest: Optional conversion manifest; when it has an entry for this XLSX
+            with a matching mtime, the stored hash is used instead of opening the file
+        
+    Returns:
+        True if the XLSX is newer than the PDF and records the PDF's current hash
+    """
+    try:
+        pdf_mtime = os.stat(pdf_path).st_mtime
+        xlsx_mtime = os.stat(xlsx_path).st_mtime
+    except OSError:
+        return False
+    
+    if pdf_mtime > xlsx_mtime:
+        return False
+    
+    entry = manifest.get(os.path.basename(xlsx_path)) if manifest else None
+    if isinstance(entry, dict) and entry.get('mtime') == xlsx_mtime:
+        stored_hash = entry.get('sha256')
+    else:
+        stored_hash = read_source_hash(xlsx_path)
+    
+    if not stored_hash:
+        return False
+    
+    try:
+        return compute_pdf_hash(pdf_path) == stored_hash
+    except OSError:
+        return False
+
+
+def should_convert_file(pdf_path: str, xlsx_path: str, existing_xlsx: Optional[Set[str]] = None) -> bool:
     """
     Check if a file should be converted, handling overwrite protection
     
     Args:
         pdf_path: Path to the input PDF file
         xlsx_path: Path where the output XLSX file would be saved
+        existing_xlsx: Optional result of list_existing_xlsx for the output
+            directory; when given it is consulted instead of checking the file system
         
     Returns:
         True if the file should be converted, False if it should be skipped
     """
     # If the XLSX file doesn't exist, proceed with conversion
-    if not check_file_exists(xlsx_path):
+    if existing_xlsx is not None:
+        xlsx_exists = os.path.basename(xlsx_path).lower() in existing_xlsx
+    else:
+        xlsx_exists = check_file_exists(xlsx_path)
+    if not xlsx_exists:
         return True
     
     # If the XLSX file exists, prompt user for overwrite confirmation
@@ -821,6 +1538,8 @@ def prompt_overwrite(file_name: str) -> bool:
     """
     while True:
         try:
+            # Show any buffered progress output before waiting for the answer
+            sys.stdout.flush()
             response = input(f"⚠️  File '{file_name}' already exists. Overwrite? (y/n): ").strip().lower()
             
             if response in ['y', 'yes']:
@@ -836,103 +1555,91 @@ def prompt_overwrite(file_name: str) -> bool:
             return False
 
 
-def handle_xlsx_conversion_error(error: Exception, file_name: str) -> None:
+@functools.lru_cache(maxsize=64)
+def _error_guidance(error_class: type, message: str) -> tuple[str, ...]:
     """
-    Handle XLSX conversion specific errors with detailed guidance
+    Pick the guidance lines for a conversion error
+    
+    Cached by exception class and message, so a batch where every file fails the
+    same way (e.g. Java missing) lower-cases and classifies the message only once.
     
     Args:
-        error: The exception that occurred during conversion
-        file_name: Name of the file that caused the error
+        error_class: Type of the exception that occurred
+        message: str() of the exception
+        
+    Returns:
+        Guidance lines to print under the error message
     """
-    error_type = type(error).__name__
-    error_message = str(error).lower()
-    
-    print(f"❌ Conversion Error for {file_name} ({error_type}):")
+    error_message = message.lower()
     
-    if isinstance(error, ImportError):
-        print(f"   {error}")
+    if issubclass(error_class, ImportError):
         if "tabula" in error_message:
-            print("   Please install tabula-py: pip install tabula-py")
-        elif "pandas" in error_message:
-            print("   Please install pandas: pip install pandas")
-        elif "openpyxl" in error_message:
-            print("   Please install openpyxl: pip install openpyxl")
-        else:
-            print("   Please install required dependencies: pip install tabula-py pandas openpyxl")
-    
-    elif isinstance(error, FileNotFoundError):
-        print(f"   {error}")
+            return ("Please install tabula-py: pip install \"tabula-py[jpype]\"",)
+        if "pandas" in error_message:
+            return ("Please install pandas: pip install pandas",)
+        if "openpyxl" in error_message:
+            return ("Please install openpyxl: pip install openpyxl",)
+        return ("Please install required dependencies: pip install \"tabula-py[jpype]\" pandas openpyxl",)
+    
+    if issubclass(error_class, FileNotFoundError):
         if "java" in error_message:
-            print("   Java Runtime Environment is required for tabula-py")
-            print("   Please install Java from: https://www.java.com/download/")
-        else:
-            print("   The PDF file may have been moved or deleted during processing")
+            return (
+                "Java Runtime Environment is required for tabula-py",
+                "Please install Java from: https://www.java.com/download/",
+            )
+        return ("The PDF file may have been moved or deleted during processing",)
     
-    elif isinstance(error, PermissionError):
-        print(f"   {error}")
-        print("   Check file permissions and ensure you have read/write access")
-        print("   Try running with elevated permissions or check file ownership")
+    if issubclass(error_class, PermissionError):
+        lines = (
+            "Check file permissions and ensure you have read/write access",
+            "Try running with elevated permissions or check file ownership",
+        )
         if "xlsx" in error_message:
-            print("   The XLSX file may be open in Excel - please close it and try again")
+            lines += ("The XLSX file may be open in Excel - please close it and try again",)
+        return lines
     
-    elif isinstance(error, OSError):
-        print(f"   {error}")
+    if issubclass(error_class, OSError):
         if "disk" in error_message or "space" in error_message:
-            print("   Insufficient disk space to complete the conversion")
-            print("   Free up disk space and try again")
-        elif "memory" in error_message:
-            print("   Insufficient memory to process this PDF file")
-            print("   Try closing other applications or processing smaller files")
-        else:
-            print("   A system-level error occurred during file processing")
+            return (
+                "Insufficient disk space to complete the conversion",
+                "Free up disk space and try again",
+            )
+        if "memory" in error_message:
+            return (
+                "Insufficient memory to process this PDF file",
+                "Try closing other applications or processing smaller files",
+            )
+        return ("A system-level error occurred during file processing",)
     
-    elif isinstance(error, ValueError):
-        print(f"   {error}")
+    if issubclass(error_class, ValueError):
         if "pdf" in error_message:
-            print("   The PDF file appears to be corrupted or invalid")
-            print("   Try opening the file in a PDF viewer to verify its integrity")
-        else:
-            print("   Invalid data encountered during conversion")
+            return (
+                "The PDF file appears to be corrupted or invalid",
+                "Try opening the file in a PDF viewer to verify its integrity",
+            )
+        return ("Invalid data encountered during conversion",)
     
-    elif "java" in error_message:
-        print(f"   {error}")
-        print("   Java Runtime Error - tabula-py requires Java to be installed")
-        print("   Please install Java from: https://www.java.com/download/")
-        print("   Ensure Java is in your system PATH")
-    
-    elif "table" in error_message and "not found" in error_message:
-        print(f"   {error}")
-        print("   No tables were found in the PDF file")
-        print("   This could mean:")
-        print("     • The PDF contains only text without tabular data")
-        print("     • The PDF is a scanned image (OCR may be needed)")
-        print("     • Tables are in a format not recognized by the extraction tools")
-        print("   Try using a different PDF or check if it contains actual tables")
-    
-    elif "memory" in error_message:
-        print(f"   {error}")
-        print("   The PDF file is too large or complex to process")
-        print("   Try processing smaller files or increase available memory")
-    
-    elif "timeout" in error_message:
-        print(f"   {error}")
-        print("   PDF processing timed out - the file may be too complex")
-        print("   Try processing a simpler PDF file")
-    
-    elif "excel" in error_message or "xlsx" in error_message:
-        print(f"   {error}")
-        print("   Error generating Excel file")
-        print("   Check that the output directory is writable")
-        print("   Ensure the XLSX file is not open in Excel")
+    for hint_key, keywords in _ERROR_HINT_RULES:
+        if all(keyword in error_message for keyword in keywords):
+            return _ERROR_HINTS[hint_key]
     
-    else:
-        print(f"   {error}")
-        print("   An unexpected error occurred during PDF to XLSX conversion")
-        print("   Please check:")
-        print("     • PDF file integrity")
-        print("     • Available disk space")
-        print("     • File permissions")
-        print("     • Java installation (required for tabula-py)")
+    return _GENERIC_ERROR_HINT
+
+
+def handle_xlsx_conversion_error(error: Exception, file_name: str) -> None:
+    """
+    Handle XLSX conversion specific errors with detailed guidance
+    
+    Args:
+        error: The exception that occurred during conversion
+        file_name: Name of the file that caused the error
+    """
+    error_type = type(error).__name__
+    
+    print(f"❌ Conversion Error for {file_name} ({error_type}):")
+    print(f"   {error}")
+    for line in _error_guidance(type(error), str(error)):
+        print(f"   {line}")
     
     print("   For more help, check the documentation or try with a different PDF file")
     print()
@@ -944,11 +1651,11 @@ def display_progress(current: int, total: int, file_name: str) -> None:
     
     Args:
         current: Current file number being processed (1-based)
-        total: Total number of files to process
+        total: Total number of files to process, or 0 if not known in advance
         file_name: Name of the current file being processed
     """
     if total <= 0:
-        print(f"🔄 Processing: {file_name}")
+        print(f"🔄 Processing ({current}): {file_name}")
     else:
         percentage = (current / total) * 100
         print(f"🔄 Processing ({current}/{total} - {percentage:.0f}%): {file_name}")
@@ -1027,89 +1734,267 @@ def display_conversion_skipped(file_name: str) -> None:
     print(f"⏭️  Skipped (file exists): {file_name}")
 
 
+def display_conversion_up_to_date(file_name: str) -> None:
+    """
+    Display message when a file is skipped because its XLSX is already up to date
+    
+    Args:
+        file_name: Name of the file that was skipped
+    """
+    print(f"⏭️  Skipped (up to date): {file_name}")
+
+
+def _convert_one(pdf_path: str) -> ConversionResult:
+    """
+    Convert a single PDF file inside a worker process
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor. Conversion
+    errors are not caught here; they propagate through the future so the parent
+    process can report them with handle_xlsx_conversion_error.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        
+    Returns:
+        ConversionResult describing the outcome of the conversion
+    """
+    pdf_filename = os.path.basename(pdf_path)
+    xlsx_path = generate_xlsx_path(pdf_path)
+    
+    if convert_pdf_to_xlsx(pdf_path, xlsx_path):
+        return ConversionResult(file_name=pdf_filename, status='success')
+    
+    # This shouldn't happen with current implementation, but handle it
+    return ConversionResult(
+        file_name=pdf_filename,
+        status='failed',
+        error_message='Unknown conversion error'
+    )
+
+
+def _convert_one_captured(pdf_path: str) -> tuple[Optional[ConversionResult], Optional[Exception], str]:
+    """
+    Run _convert_one in a pool worker with its console output captured
+    
+    Workers print nothing themselves; the parent process writes each file's output
+    as one block, so lines from files converting at the same time never interleave.
+    
+    Args:
+        pdf_path: Path to the input PDF file
+        
+    Returns:
+        Tuple of (result, error, output) where exactly one of result/error is set
+        and output is everything the conversion printed
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            result, error = _convert_one(pdf_path), None
+        except Exception as e:
+            result, error = None, e
+    return result, error, output.getvalue()
+
+
+async def batch_convert(pdf_paths: List[str], max_concurrency: Optional[int] = None) -> List[ConversionResult]:
+    """
+    Convert PDF files to XLSX from async code without blocking the event loop
+    
+    Each conversion runs in a worker thread via asyncio.to_thread, and a semaphore
+    bounds how many run at once, so reading one PDF overlaps with parsing another.
+    Overwrite protection is the caller's responsibility: existing XLSX files are
+    replaced without prompting.
+    
+    Args:
+        pdf_paths: Paths of the PDF files to convert
+        max_concurrency: Maximum number of conversions in flight
+            (defaults to the number of CPUs)
+        
+    Returns:
+        One ConversionResult per input path, in the same order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+    
+    async def convert(pdf_path: str) -> ConversionResult:
+        pdf_filename = os.path.basename(pdf_path)
+        async with semaphore:
+            try:
+                success = await asyncio.to_thread(convert_pdf_to_xlsx, pdf_path, generate_xlsx_path(pdf_path))
+            except Exception as error:
+                return ConversionResult(file_name=pdf_filename, status='failed', error_message=str(error))
+        
+        if success:
+            return ConversionResult(file_name=pdf_filename, status='success')
+        return ConversionResult(
+            file_name=pdf_filename,
+            status='failed',
+            error_message='Unknown conversion error'
+        )
+    
+    return list(await asyncio.gather(*(convert(pdf_path) for pdf_path in pdf_paths)))
+
+
 def pdf_to_xlsx_batch_convert() -> None:
     """
     Orchestrate the entire batch conversion process for PDF to XLSX
     
     This function integrates file discovery, conversion, error handling, and progress feedback.
     It continues processing after individual file failures and tracks conversion statistics.
+    
+    Files are handled in chunks of BATCH_CHUNK_SIZE. For each chunk the overwrite
+    prompts are answered in the main process and the approved files are submitted
+    to a process pool (table extraction is CPU-bound and each file is independent).
+    The pool keeps converting while the next chunk's prompts are answered; the
+    batch only waits for results when more than a chunk of files is in flight.
+    Each file's result is written to RESULTS_FILE_NAME. PDF files are discovered
+    lazily and never collected into a list, so memory use does not grow with the
+    size of the batch.
     """
     # Initialize conversion statistics
     successful_count = 0
     failed_count = 0
     skipped_count = 0
-    conversion_results = []
+    processed_count = 0
     
     try:
         # Get current working directory
         current_directory = os.getcwd()
         
-        # Discover PDF files in the current directory
-        pdf_files = get_pdf_files(current_directory)
-        
-        # Display total number of files found
-        display_file_count(len(pdf_files))
+        # Discover PDF files lazily, so conversion starts before the whole directory is listed
+        pdf_iter = iter_pdf_files(current_directory)
+        first_pdf = next(pdf_iter, None)
         
         # If no PDF files found, exit early
-        if not pdf_files:
+        if first_pdf is None:
+            display_file_count(0)
             display_summary(successful_count, failed_count, skipped_count)
             return
         
-        print()  # Add blank line for better readability
+        pdf_iter = itertools.chain((first_pdf,), pdf_iter)
+        
+        # Hashes of previously generated outputs, so up-to-date checks needn't open them
+        manifest = load_conversion_manifest(current_directory)
         
-        # Process each PDF file
-        for index, pdf_path in enumerate(pdf_files, 1):
-            pdf_filename = os.path.basename(pdf_path)
-            xlsx_path = generate_xlsx_path(pdf_path)
-            xlsx_filename = os.path.basename(xlsx_path)
+        # Existing outputs, listed once so the per-file checks needn't stat them
+        existing_xlsx = list_existing_xlsx(current_directory)
+        
+        results_path = os.path.join(current_directory, RESULTS_FILE_NAME)
+        with open(results_path, 'w', newline='', encoding='utf-8') as results_file, \
+                ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_batch_worker) as executor:
+            # Each result is written as soon as it is known rather than kept in a list
+            results_writer = csv.DictWriter(results_file, fieldnames=[field.name for field in fields(ConversionResult)])
+            results_writer.writeheader()
             
-            # Display progress
-            display_progress(index, len(pdf_files), pdf_filename)
+            # Submitted conversions that have not been reported yet: future -> PDF path
+            pending = {}
+            manifest_changed = False
             
-            try:
-                # Check if we should convert this file (handles overwrite protection)
-                if not should_convert_file(pdf_path, xlsx_path):
-                    # User declined to overwrite existing file
-                    display_conversion_skipped(pdf_filename)
-                    skipped_count += 1
-                    conversion_results.append(ConversionResult(
-                        file_name=pdf_filename,
-                        status='skipped',
-                        error_message='User declined to overwrite existing XLSX file'
-                    ))
-                    continue
+            def report(future) -> None:
+                """Display and record the outcome of one finished conversion"""
+                nonlocal successful_count, failed_count, processed_count, manifest_changed
+                pdf_path = pending.pop(future)
+                pdf_filename = os.path.basename(pdf_path)
+                processed_count += 1
+                
+                # Display progress
+                display_progress(processed_count, 0, pdf_filename)
+                
+                try:
+                    result, error, output = future.result()
+                except Exception as pool_error:
+                    # The worker itself failed (e.g. it was killed)
+                    result, error, output = None, pool_error, ""
+                
+                # Replay the worker's output in one block under its progress line
+                sys.stdout.write(output)
                 
-                # Attempt the conversion
-                success = convert_pdf_to_xlsx(pdf_path, xlsx_path)
+                if error is not None:
+                    # Handle conversion error gracefully and continue with next file
+                    handle_xlsx_conversion_error(error, pdf_filename)
+                    sys.stdout.flush()
+                    failed_count += 1
+                    results_writer.writerow(asdict(ConversionResult(
+                        file_name=pdf_filename,
+                        status='failed',
+                        error_message=str(error)
+                    )))
+                    return
                 
-                if success:
+                if result.status == 'success':
                     display_conversion_success(pdf_filename)
                     successful_count += 1
-                    conversion_results.append(ConversionResult(
-                        file_name=pdf_filename,
-                        status='success'
-                    ))
+                    xlsx_path = generate_xlsx_path(pdf_path)
+                    record_conversion(manifest, xlsx_path)
+                    existing_xlsx.add(os.path.basename(xlsx_path).lower())
+                    manifest_changed = True
                 else:
-                    # This shouldn't happen with current implementation, but handle it
                     print(f"❌ Conversion failed for {pdf_filename}: Unknown error")
                     failed_count += 1
-                    conversion_results.append(ConversionResult(
+                results_writer.writerow(asdict(result))
+                
+                # One flush per file rather than one per printed line
+                sys.stdout.flush()
+            
+            while True:
+                chunk = list(itertools.islice(pdf_iter, BATCH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                
+                # Answer the chunk's overwrite prompts; earlier chunks keep converting meanwhile
+                for pdf_path in chunk:
+                    pdf_filename = os.path.basename(pdf_path)
+                    xlsx_path = generate_xlsx_path(pdf_path)
+                    xlsx_exists = os.path.basename(xlsx_path).lower() in existing_xlsx
+                    
+                    # Outputs generated from the current PDF contents need no prompt or conversion
+                    if xlsx_exists and is_xlsx_up_to_date(pdf_path, xlsx_path, manifest):
+                        display_conversion_up_to_date(pdf_filename)
+                        skipped_count += 1
+                        processed_count += 1
+                        results_writer.writerow(asdict(ConversionResult(
+                            file_name=pdf_filename,
+                            status='skipped',
+                            error_message='XLSX file is already up to date'
+                        )))
+                        continue
+                    
+                    # Check if we should convert this file (handles overwrite protection)
+                    if should_convert_file(pdf_path, xlsx_path, existing_xlsx):
+                        pending[executor.submit(_convert_one_captured, pdf_path)] = pdf_path
+                        continue
+                    
+                    # User declined to overwrite existing file
+                    display_conversion_skipped(pdf_filename)
+                    skipped_count += 1
+                    processed_count += 1
+                    results_writer.writerow(asdict(ConversionResult(
                         file_name=pdf_filename,
-                        status='failed',
-                        error_message='Unknown conversion error'
-                    ))
+                        status='skipped',
+                        error_message='User declined to overwrite existing XLSX file'
+                    )))
                 
-            except Exception as error:
-                # Handle conversion error gracefully and continue with next file
-                handle_xlsx_conversion_error(error, pdf_filename)
-                failed_count += 1
-                conversion_results.append(ConversionResult(
-                    file_name=pdf_filename,
-                    status='failed',
-                    error_message=str(error)
-                ))
-                # Continue processing the next file
-                continue
+                sys.stdout.flush()
+                
+                # Report what finished while the prompts were answered, and wait only
+                # when more than a chunk of conversions is still in flight
+                for future in [future for future in pending if future.done()]:
+                    report(future)
+                while len(pending) > BATCH_CHUNK_SIZE:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report(future)
+                
+                # Persist the results and manifest entries reported so far
+                results_file.flush()
+                if manifest_changed:
+                    save_conversion_manifest(current_directory, manifest)
+                    manifest_changed = False
+            
+            # No prompts remain; report the rest as they complete
+            for future in as_completed(list(pending)):
+                report(future)
+            
+            if manifest_changed:
+                save_conversion_manifest(current_directory, manifest)
         
         # Display final summary
         display_summary(successful_count, failed_count, skipped_count)
@@ -1135,51 +2020,58 @@ def clean_table_data(table: pd.DataFrame, assume_header: bool = True) -> pd.Data
     Returns:
         Cleaned DataFrame
     """
+    _import_table_libraries()
+    
     if table is None or table.empty:
         return pd.DataFrame()
     
-    # Make a copy to avoid modifying the original
-    cleaned = table.copy()
-    
-    # Remove completely empty rows and columns
-    cleaned = cleaned.dropna(how='all')  # Remove rows where all values are NaN
-    cleaned = cleaned.dropna(axis=1, how='all')  # Remove columns where all values are NaN
+    # Remove completely empty rows and columns. Both masks come from one scan of the
+    # NaN mask; rows that are all NaN never decide whether a column is kept, so this
+    # matches dropping rows first and then columns.
+    has_value = table.notna().to_numpy()
+    row_keep = has_value.any(axis=1)
     
     # If table is still empty after cleaning, return empty DataFrame
-    if cleaned.empty:
+    if not row_keep.any():
         return pd.DataFrame()
     
+    # Boolean iloc returns a new frame, so the in-place steps below never modify
+    # the caller's table and no up-front copy is needed
+    cleaned = table.iloc[row_keep, has_value.any(axis=0)]
+    
     # Reset index after dropping rows
-    cleaned = cleaned.reset_index(drop=True)
+    cleaned.reset_index(drop=True, inplace=True)
     
-    # Replace NaN values with empty strings for better Excel compatibility
+    # Replace NaN values with empty strings for better Excel compatibility. Not in
+    # place: pandas refuses to store '' in a float column, fillna upcasts instead
     cleaned = cleaned.fillna('')
     
     # Clean column names - remove extra whitespace and handle unnamed columns
-    new_columns = []
-    for i, col in enumerate(cleaned.columns):
-        if pd.isna(col) or str(col).strip() == '' or 'Unnamed' in str(col):
-            new_columns.append(f'Column_{i+1}')
-        else:
-            new_columns.append(str(col).strip())
-    cleaned.columns = new_columns
+    columns = pd.Index(cleaned.columns)
+    stripped = columns.astype(str).str.strip()
+    unnamed = columns.isna() | (stripped == '') | stripped.str.contains('Unnamed', regex=False)
+    placeholders = [f'Column_{i+1}' for i in range(len(columns))]
+    cleaned.columns = np.where(unnamed, placeholders, stripped).tolist()
     
     # If we have very few rows (less than 2) and assume_header is True,
     # it might not be a real table
     if assume_header and len(cleaned) < 2:
         return pd.DataFrame()
     
-    # Check if the table has meaningful content (not just empty strings)
+    # Check if the table has meaningful content (not just empty strings).
+    # Whitespace-only cells count as empty, matching str(val).strip() != ''.
+    # Rows are counted in blocks of a tenth of the table, stopping once 10% of all
+    # cells are known to have content, so a dense table is decided by its first block.
+    required_cells = cleaned.size * 0.1
+    block_rows = -(-len(cleaned) // 10)
     non_empty_cells = 0
-    total_cells = cleaned.shape[0] * cleaned.shape[1]
-    
-    for col in cleaned.columns:
-        for val in cleaned[col]:
-            if str(val).strip() != '':
-                non_empty_cells += 1
-    
-    # If less than 10% of cells have content, probably not a real table
-    if total_cells > 0 and (non_empty_cells / total_cells) < 0.1:
+    for start in range(0, len(cleaned), block_rows):
+        cells = cleaned.iloc[start:start + block_rows].to_numpy(dtype=str)
+        non_empty_cells += int(np.count_nonzero(np.char.strip(cells)))
+        if non_empty_cells >= required_cells:
+            break
+    else:
+        # If less than 10% of cells have content, probably not a real table
         return pd.DataFrame()
     
     return cleaned
@@ -1189,6 +2081,10 @@ def main() -> None:
     """
     Main entry point for the PDF to XLSX converter application
     """
+    # Stop flushing on every line; the batch flushes once per file instead
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     try:
         print("PDF to XLSX Converter")
         print("=" * 50)
@@ -4,17 +4,33 @@ PDF to XLSX Single File Converter
 
 A command-line utility to convert a specific PDF file to XLSX format by extracting tables.
 Usage: python pdf_to_xlsx_single.py <pdf_file_path> [output_file_path]
+       python pdf_to_xlsx_single.py <pdf_file_path> <pdf_file_path> ...
 """
 
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import json
+import mmap
+import multiprocessing
+import multiprocessing.util
 import os
+import re
+import shutil
 import sys
-import subprocess
-from typing import List, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 import tabula
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
 
 # Optional import for pdfplumber as backup
 try:
@@ -23,33 +39,74 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+# 可选导入xlsxwriter作为快速写入器（未安装时使用openpyxl）
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# tabula提取策略，按优先级排列: (提取方法, 名称, read_pdf参数)
+TABULA_STRATEGIES = (
+    ("tabula-default", "默认", {'pandas_options': {'header': 0}}),
+    # lattice方法（适用于有边框的表格）
+    ("tabula-lattice", "Lattice", {'lattice': True, 'pandas_options': {'header': 0}}),
+    # stream方法（适用于无边框的表格）
+    ("tabula-stream", "Stream", {'stream': True, 'pandas_options': {'header': 0}}),
+)
+
+# 安装pdfplumber时先按页面框线选择lattice或stream，失败或没有表格时再使用上面三次整份文档的提取: (提取方法, 名称)
+PARTITIONED_STRATEGY = ("tabula-partitioned", "按页Lattice/Stream")
+
+# 页面上水平和垂直框线超过这个数量时视为有边框表格，使用lattice方法
+LATTICE_MIN_RULING_LINES = 4
+
+# 数字文本：只包含数字、'.'、','、'%'、'-'且至少有一个数字，模块加载时编译一次
+_NUMERIC_TEXT_RE = re.compile(r'[\d.,%-]*\d[\d.,%-]*')
+
+# 启动tabula的JVM时使用的选项：短时间运行用串行GC、只做C1编译，并通过CDS映射共享类以加快冷启动
+TABULA_JAVA_OPTIONS = ("-XX:+UseSerialGC", "-XX:TieredStopAtLevel=1", "-Xshare:auto")
+
+# pdfplumber按页块并行提取时，每个任务处理的页数
+PDFPLUMBER_PAGES_PER_TASK = 4
+
+# 少于这个页数时pdfplumber不单独启动进程池：启动一个spawn进程约需0.8秒（重新导入pandas、
+# pdfplumber和tabula并重新打开PDF），而分析一页表格约需15-20毫秒，常见的几十页文档串行更快
+PDFPLUMBER_MIN_PARALLEL_PAGES = 50
+
+# 记录结构指纹对应的成功提取方法，相似的PDF下次先只运行这个方法
+STRATEGY_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'pdfconvert', 'strategies.json')
+
+# is_valid_pdf_file的结果缓存：路径 -> ((修改时间, 文件大小), (是否有效, 错误信息))
+_VALIDATION_CACHE: Dict[str, tuple] = {}
+
+# 首次调用tabula时在进程内启动JVM，用锁避免并行策略重复启动
+_TABULA_VM_LOCK = threading.Lock()
+_tabula_vm_started = False
+
+# 批量转换的工作进程中为False，pdfplumber不再启动自己的进程池
+_pdfplumber_pool_allowed = True
 
+
+@functools.lru_cache(maxsize=1)
 def check_java_installation() -> tuple[bool, str]:
-    """检查Java是否安装"""
-    try:
-        result = subprocess.run(
-            ['java', '-version'], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        
-        if result.returncode == 0:
-            version_output = result.stderr.strip()
-            if version_output:
-                lines = version_output.split('\n')
-                if lines:
-                    return True, lines[0]
-            return True, "Java is installed"
-        else:
-            return False, "Java command failed to execute"
-            
-    except subprocess.TimeoutExpired:
-        return False, "Java command timed out"
-    except FileNotFoundError:
+    """检查Java是否可用（只查找java可执行文件，不启动java进程；结果在进程内缓存）"""
+    # tabula已经在进程内启动了JVM
+    jpype = sys.modules.get('jpype')
+    if jpype is not None and jpype.isJVMStarted():
+        return True, "JVM is already running in this process"
+    
+    # 先在PATH中查找，再查找JAVA_HOME/bin
+    java_path = shutil.which('java')
+    if java_path is None:
+        java_home = os.environ.get('JAVA_HOME')
+        if java_home:
+            java_path = shutil.which('java', path=os.path.join(java_home, 'bin'))
+    
+    if java_path is None:
         return False, "Java command not found - Java may not be installed"
-    except Exception as e:
-        return False, f"Error checking Java installation: {e}"
+    
+    return True, f"Java found at {java_path}"
 
 
 def check_dependencies():
@@ -72,9 +129,18 @@ def check_dependencies():
         print("✅ tabula-py 可用")
     except ImportError:
         print("❌ 未安装tabula-py")
-        print("   请使用以下命令安装: pip install tabula-py")
+        print("   请使用以下命令安装: pip install \"tabula-py[jpype]\"")
         missing_deps.append("tabula-py")
     
+    # 检查jpype（可选，tabula在进程内复用同一个JVM，而不是每次调用都启动java子进程）
+    try:
+        import jpype
+        print("✅ jpype 可用 (tabula在进程内运行)")
+    except ImportError:
+        print("⚠️ jpype 未安装 (可选)")
+        print("   tabula每次提取都会启动新的java子进程")
+        print("   为了更快地提取，建议安装: pip install \"tabula-py[jpype]\"")
+    
     try:
         import pandas as pd
         print("✅ pandas 可用")
@@ -97,10 +163,16 @@ def check_dependencies():
         print("⚠️ pdfplumber 未安装 (可选)")
         print("   为了更好的表格提取效果，建议安装: pip install pdfplumber")
     
+    if XLSXWRITER_AVAILABLE:
+        print("✅ xlsxwriter 可用 (可选快速写入)")
+    else:
+        print("⚠️ xlsxwriter 未安装 (可选)")
+        print("   为了更快地写入XLSX文件，建议安装: pip install xlsxwriter")
+    
     if missing_deps:
         print(f"\n❌ 缺少依赖: {', '.join(missing_deps)}")
         print("\n安装所有必需依赖:")
-        print("pip install tabula-py pandas openpyxl")
+        print("pip install \"tabula-py[jpype]\" pandas openpyxl")
         if "java" in missing_deps:
             print("\n同时需要安装Java: https://www.java.com/download/")
         return False
@@ -110,29 +182,46 @@ def check_dependencies():
 
 
 def is_valid_pdf_file(pdf_path: str) -> tuple[bool, str]:
-    """检查PDF文件是否有效"""
+    """检查PDF文件是否有效（文件未修改时直接返回缓存的结果）"""
+    try:
+        stat = os.stat(pdf_path)
+    except OSError as e:
+        return False, f"读取文件错误: {e}"
+    
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _VALIDATION_CACHE.get(pdf_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    result = _check_pdf_structure(pdf_path)
+    _VALIDATION_CACHE[pdf_path] = (signature, result)
+    return result
+
+
+def _check_pdf_structure(pdf_path: str) -> tuple[bool, str]:
+    """通过内存映射检查PDF文件头部和尾部的结构，不把内容读入缓冲区"""
     try:
         with open(pdf_path, 'rb') as f:
-            header = f.read(1024)
+            file_size = os.fstat(f.fileno()).st_size
             
-            if not header.startswith(b'%PDF'):
+            # 空文件无法内存映射，也不可能是有效的PDF
+            if file_size == 0:
                 return False, "文件没有有效的PDF头部"
             
-            f.seek(0, 2)
-            file_size = f.tell()
-            if file_size < 100:
-                return False, "文件太小，不是有效的PDF"
-            
-            if b'obj' not in header and b'endobj' not in header:
-                f.seek(0)
-                content = f.read(4096)
-                if b'obj' not in content:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:4] != b'%PDF':
+                    return False, "文件没有有效的PDF头部"
+                
+                if file_size < 100:
+                    return False, "文件太小，不是有效的PDF"
+                
+                # 'endobj'包含'obj'，只需在前4KB中查找'obj'
+                if mm.find(b'obj', 0, min(file_size, 4096)) == -1:
                     return False, "文件不包含有效的PDF对象结构"
-            
-            f.seek(max(0, file_size - 1024))
-            tail = f.read()
-            if b'%%EOF' not in tail:
-                return False, "文件没有有效的PDF结束标记"
+                
+                # 只在最后1KB中反向查找结束标记
+                if mm.rfind(b'%%EOF', max(0, file_size - 1024)) == -1:
+                    return False, "文件没有有效的PDF结束标记"
             
         return True, ""
         
@@ -140,8 +229,8 @@ def is_valid_pdf_file(pdf_path: str) -> tuple[bool, str]:
         return False, f"读取文件错误: {e}"
 
 
-def extract_tables_from_pdf(pdf_path: str) -> tuple[bool, List[pd.DataFrame], str]:
-    """从PDF中提取表格"""
+def extract_tables_from_pdf(pdf_path: str, pdfplumber_executor: Optional[ProcessPoolExecutor] = None) -> tuple[bool, List[pd.DataFrame], str]:
+    """从PDF中提取表格（可传入共享的进程池供pdfplumber并行分析页面）"""
     try:
         is_valid, error_msg = is_valid_pdf_file(pdf_path)
         if not is_valid:
@@ -149,73 +238,36 @@ def extract_tables_from_pdf(pdf_path: str) -> tuple[bool, List[pd.DataFrame], st
         
         print(f"🔍 从PDF中提取表格: {os.path.basename(pdf_path)}")
         
-        # 策略1: 默认设置
-        try:
-            print("  📋 尝试默认表格提取...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                pandas_options={'header': 0}
-            )
+        # 指纹、按页分组和pdfplumber备用方案共用同一个pdfplumber文档，只打开和解析一次
+        with _open_pdfplumber(pdf_path) as plumber_pdf:
+            # 能打开pdfplumber文档时先按页分组运行lattice/stream，分组提取出错或没有找到
+            # 表格时再依次使用三种整份文档的tabula方法
+            strategies = [
+                (method, label, functools.partial(_read_pdf_tables, pdf_path, **options))
+                for method, label, options in TABULA_STRATEGIES
+            ]
+            if plumber_pdf is not None:
+                strategies.insert(0, PARTITIONED_STRATEGY + (functools.partial(_read_partitioned_tables, pdf_path, plumber_pdf),))
             
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
-                if valid_tables:
-                    return True, valid_tables, "tabula-default"
-        except Exception as e:
-            print(f"  ⚠️ 默认提取失败: {e}")
-        
-        # 策略2: lattice方法
-        try:
-            print("  📋 尝试lattice方法...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                lattice=True,
-                pandas_options={'header': 0}
+            read_plumber_tables = functools.partial(
+                extract_with_pdfplumber, pdf_path, executor=pdfplumber_executor, pdf=plumber_pdf
             )
             
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
+            # 结构相似的PDF先只运行上次成功的提取方法
+            page_count = len(plumber_pdf.pages) if plumber_pdf is not None else 0
+            fingerprint = compute_pdf_fingerprint(pdf_path, page_count)
+            cached_method = load_strategy_cache().get(fingerprint) if fingerprint else None
+            if cached_method:
+                valid_tables = _run_cached_strategy(cached_method, strategies, read_plumber_tables)
                 if valid_tables:
-                    return True, valid_tables, "tabula-lattice"
-        except Exception as e:
-            print(f"  ⚠️ Lattice提取失败: {e}")
-        
-        # 策略3: stream方法
-        try:
-            print("  📋 尝试stream方法...")
-            tables = tabula.read_pdf(
-                pdf_path,
-                pages='all',
-                multiple_tables=True,
-                stream=True,
-                pandas_options={'header': 0}
-            )
+                    return True, valid_tables, cached_method
             
-            if tables and len(tables) > 0:
-                valid_tables = process_extracted_tables(tables)
-                if valid_tables:
-                    return True, valid_tables, "tabula-stream"
-        except Exception as e:
-            print(f"  ⚠️ Stream提取失败: {e}")
-        
-        # 策略4: pdfplumber备用方案
-        if PDFPLUMBER_AVAILABLE:
-            try:
-                print("  📋 尝试pdfplumber备用方案...")
-                tables = extract_with_pdfplumber(pdf_path)
-                
-                if tables and len(tables) > 0:
-                    valid_tables = process_extracted_tables(tables, assume_header=False)
-                    if valid_tables:
-                        return True, valid_tables, "pdfplumber"
-            except Exception as e:
-                print(f"  ⚠️ pdfplumber提取失败: {e}")
-        
-        return False, [], "使用所有方法都未找到表格。PDF可能不包含表格数据或表格为图像格式。"
+            # 缓存的方法已经试过，不再重复运行
+            success, tables, method = _run_all_strategies(strategies, read_plumber_tables, skip_method=cached_method)
+            if success and fingerprint and method != cached_method:
+                save_strategy(fingerprint, method)
+            
+            return success, tables, method
         
     except Exception as e:
         error_msg = str(e).lower()
@@ -234,6 +286,212 @@ def extract_tables_from_pdf(pdf_path: str) -> tuple[bool, List[pd.DataFrame], st
         return False, [], detailed_error
 
 
+def _run_all_strategies(strategies: list, read_plumber_tables,
+                        skip_method: Optional[str] = None) -> tuple[bool, List[pd.DataFrame], str]:
+    """按优先级运行tabula方法，都没有找到有效表格时再使用pdfplumber（跳过skip_method）"""
+    strategies = [strategy for strategy in strategies if strategy[0] != skip_method]
+    
+    # 第一种方法单独运行，大多数PDF用它就能找到表格
+    method, label, read_tables = strategies[0]
+    print(f"  📋 尝试tabula方法: {label}")
+    valid_tables = _strategy_tables(label, read_tables)
+    if valid_tables:
+        return True, valid_tables, method
+    
+    # 其余tabula方法同时运行，但仍按优先级检查结果，选中的策略与依次尝试时相同。
+    # 离开with块时会等待所有方法结束，落选的方法也会运行完毕
+    remaining = strategies[1:]
+    if remaining:
+        print(f"  📋 同时运行其余{len(remaining)}种tabula方法...")
+        with ThreadPoolExecutor(max_workers=len(remaining)) as executor:
+            futures = [executor.submit(read) for _, _, read in remaining]
+            
+            for future, (method, label, _) in zip(futures, remaining):
+                valid_tables = _strategy_tables(label, future.result)
+                if valid_tables:
+                    return True, valid_tables, method
+    
+    # 所有tabula方法都没有找到表格时才使用pdfplumber备用方案
+    if PDFPLUMBER_AVAILABLE and skip_method != "pdfplumber":
+        print("  📋 尝试pdfplumber备用方案...")
+        valid_tables = _strategy_tables("pdfplumber", read_plumber_tables, assume_header=False)
+        if valid_tables:
+            return True, valid_tables, "pdfplumber"
+    
+    return False, [], "使用所有方法都未找到表格。PDF可能不包含表格数据或表格为图像格式。"
+
+
+def _strategy_tables(label: str, read_tables, assume_header: bool = True) -> List[pd.DataFrame]:
+    """运行一种提取方法并清理表格，失败时返回空列表（清理出错也只影响这一种方法）"""
+    try:
+        tables = read_tables()
+        return process_extracted_tables(tables, assume_header=assume_header) if tables else []
+    except Exception as e:
+        print(f"  ⚠️ {label}提取失败: {e}")
+        return []
+
+
+def _run_cached_strategy(method: str, strategies: list, read_plumber_tables) -> List[pd.DataFrame]:
+    """只运行缓存中记录的提取方法，失败或该方法当前不可用时返回空列表"""
+    if method == "pdfplumber":
+        if not PDFPLUMBER_AVAILABLE:
+            return []
+        read_tables = read_plumber_tables
+        assume_header = False
+    else:
+        readers = {strategy_method: read for strategy_method, _, read in strategies}
+        if method not in readers:
+            return []
+        read_tables = readers[method]
+        assume_header = True
+    
+    print(f"  ♻️ 先使用相似PDF上次成功的提取方法: {method}")
+    return _strategy_tables(method, read_tables, assume_header=assume_header)
+
+
+def compute_pdf_fingerprint(pdf_path: str, page_count: int = 0) -> Optional[str]:
+    """
+    计算PDF的结构指纹：页数 + 前4KB内容的哈希
+    
+    页数由调用方从已打开的文档中取得，这里不再打开PDF解析。同一模板生成的PDF
+    （如每月报表）通常得到相同的指纹。无法读取时返回None。
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    
+    return f"{page_count}-{hashlib.sha256(head).hexdigest()[:16]}"
+
+
+def load_strategy_cache() -> Dict[str, str]:
+    """读取指纹到成功提取方法的缓存，文件不存在或损坏时返回空字典"""
+    try:
+        with open(STRATEGY_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_strategy(fingerprint: str, method: str) -> None:
+    """记录指纹对应的成功提取方法（写入失败不影响转换）"""
+    cache = load_strategy_cache()
+    cache[fingerprint] = method
+    temp_path = f"{STRATEGY_CACHE_FILE}.{os.getpid()}.tmp"
+    
+    try:
+        os.makedirs(os.path.dirname(STRATEGY_CACHE_FILE), exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        # 原子替换，同时转换多个文件时不会读到写了一半的缓存
+        os.replace(temp_path, STRATEGY_CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def _read_partitioned_tables(pdf_path: str, pdf) -> List[pd.DataFrame]:
+    """
+    按页面分组提取表格：有框线的连续页面用lattice，其余用stream，表格保持页码顺序
+    
+    lattice在一组页面上没有找到表格时（框线可能只是装饰），再用stream提取这些页面。
+    """
+    tables = []
+    
+    for pages, options in plan_tabula_passes(pdf):
+        pass_tables = _read_pdf_tables(pdf_path, pages=pages, pandas_options={'header': 0}, **options)
+        if not pass_tables and options.get('lattice'):
+            pass_tables = _read_pdf_tables(pdf_path, pages=pages, pandas_options={'header': 0}, stream=True)
+        tables.extend(pass_tables)
+    
+    return tables
+
+
+def plan_tabula_passes(pdf) -> List[tuple[str, dict]]:
+    """
+    根据已打开的pdfplumber文档中每页的框线数量规划tabula提取
+    
+    连续的同类页面合并为一次提取，返回 [(页码范围, read_pdf参数), ...]
+    """
+    ruled_pages = [_has_ruling_lines(page) for page in pdf.pages]
+    
+    passes = []
+    first_page = 1
+    for ruled, group in itertools.groupby(ruled_pages):
+        last_page = first_page + len(list(group)) - 1
+        passes.append((f"{first_page}-{last_page}", {'lattice': True} if ruled else {'stream': True}))
+        first_page = last_page + 1
+    
+    return passes
+
+
+def _has_ruling_lines(page) -> bool:
+    """检查页面是否有足够的水平/垂直框线（包括矩形和曲线的边）"""
+    ruling_lines = sum(1 for edge in page.edges if edge['orientation'] in ('h', 'v'))
+    return ruling_lines > LATTICE_MIN_RULING_LINES
+
+
+def _open_pdfplumber(pdf_path: str):
+    """打开pdfplumber文档；未安装或无法解析时返回产生None的上下文（此时只使用tabula）"""
+    if PDFPLUMBER_AVAILABLE:
+        try:
+            return pdfplumber.open(pdf_path)
+        except Exception as e:
+            print(f"  ⚠️ pdfplumber无法打开PDF: {e}")
+    
+    return contextlib.nullcontext()
+
+
+def _read_pdf_tables(pdf_path: str, pages='all', **options) -> List[pd.DataFrame]:
+    """用tabula提取PDF指定页面的表格（安装jpype时所有策略共用进程内的JVM）"""
+    global _tabula_vm_started
+    
+    if not _tabula_vm_started:
+        # 第一次调用负责启动JVM，其他策略等待它完成后再复用
+        with _TABULA_VM_LOCK:
+            if not _tabula_vm_started:
+                try:
+                    return _run_tabula(pdf_path, pages, **options)
+                finally:
+                    _tabula_vm_started = True
+    
+    return _run_tabula(pdf_path, pages, **options)
+
+
+def _run_tabula(pdf_path: str, pages, **options) -> List[pd.DataFrame]:
+    """调用tabula.read_pdf，未安装jpype时tabula自动退回子进程方式"""
+    return tabula.read_pdf(
+        pdf_path,
+        pages=pages,
+        multiple_tables=True,
+        force_subprocess=False,
+        java_options=_tabula_java_options(),
+        **options
+    )
+
+
+def _tabula_java_options() -> Optional[List[str]]:
+    """获取启动java时的选项（进程内JVM已启动时选项不再生效，不再传入）"""
+    jpype = sys.modules.get('jpype')
+    if jpype is not None and jpype.isJVMStarted():
+        return None
+    
+    # tabula会在传入的列表上追加选项，每次返回新列表
+    return list(TABULA_JAVA_OPTIONS)
+
+
+def shutdown_jvm() -> None:
+    """关闭tabula在本进程中启动的JVM（如果有）"""
+    jpype = sys.modules.get('jpype')
+    if jpype is not None and jpype.isJVMStarted():
+        jpype.shutdownJVM()
+
+
 def process_extracted_tables(tables: List[pd.DataFrame], assume_header: bool = True) -> List[pd.DataFrame]:
     """处理和清理提取的表格"""
     valid_tables = []
@@ -251,27 +509,41 @@ def process_extracted_tables(tables: List[pd.DataFrame], assume_header: bool = T
     return valid_tables
 
 
-def extract_with_pdfplumber(pdf_path: str) -> List[pd.DataFrame]:
-    """使用pdfplumber提取表格"""
+def extract_with_pdfplumber(pdf_path: str, executor: Optional[ProcessPoolExecutor] = None, pdf=None) -> List[pd.DataFrame]:
+    """
+    使用pdfplumber提取表格
+    
+    版面分析是CPU密集型的，页块可以分给多个进程并行分析，结果按页码顺序合并。调用方传入
+    进程池时直接使用它；否则只有在多CPU且至少PDFPLUMBER_MIN_PARALLEL_PAGES页时才临时
+    启动进程池（批量转换的工作进程中不启动）。进程使用spawn方式启动，因为调用方可能同时运行着tabula线程，在多线程进程中
+    fork并不安全。调用方已打开文档时传入pdf，串行分析时直接复用，不再重新打开和解析。
+    """
     if not PDFPLUMBER_AVAILABLE:
         return []
     
     tables = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                page_tables = page.extract_tables()
-                
-                if page_tables:
-                    for table_data in page_tables:
-                        if table_data and len(table_data) > 1:
-                            df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                            df = df.dropna(how='all')
-                            df = df.dropna(axis=1, how='all')
-                            
-                            if not df.empty:
-                                tables.append(df)
+        with (contextlib.nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path)) as pdf:
+            page_count = len(pdf.pages)
+            starts = range(0, page_count, PDFPLUMBER_PAGES_PER_TASK)
+            workers = min(os.cpu_count() or 1, len(starts))
+            
+            # 只有一个页块时不需要进程池；没有传入进程池时，只有一个CPU或页数较少也串行分析
+            if len(starts) <= 1 or (executor is None and (
+                    not _pdfplumber_pool_allowed or workers <= 1 or page_count < PDFPLUMBER_MIN_PARALLEL_PAGES)):
+                return _tables_from_pages(pdf.pages)
+        
+        stops = [min(start + PDFPLUMBER_PAGES_PER_TASK, page_count) for start in starts]
+        pool = executor or ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            # map按提交顺序返回结果，表格保持原来的页码顺序
+            for block_tables in pool.map(_extract_pdfplumber_pages, itertools.repeat(pdf_path), starts, stops):
+                tables.extend(block_tables)
+        finally:
+            # 只关闭自己启动的进程池
+            if executor is None:
+                pool.shutdown()
     
     except Exception as e:
         print(f"  ⚠️ pdfplumber处理错误: {e}")
@@ -279,43 +551,57 @@ def extract_with_pdfplumber(pdf_path: str) -> List[pd.DataFrame]:
     return tables
 
 
+def _extract_pdfplumber_pages(pdf_path: str, start: int, stop: int) -> List[pd.DataFrame]:
+    """在子进程中提取一段页面的表格（定义在模块级以便进程池调用）"""
+    with pdfplumber.open(pdf_path) as pdf:
+        return _tables_from_pages(pdf.pages[start:stop])
+
+
+def _tables_from_pages(pages) -> List[pd.DataFrame]:
+    """从pdfplumber页面中提取表格"""
+    tables = []
+    
+    for page in pages:
+        page_tables = page.extract_tables()
+        
+        if page_tables:
+            for table_data in page_tables:
+                if table_data and len(table_data) > 1:
+                    df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                    df = df.dropna(how='all')
+                    df = df.dropna(axis=1, how='all')
+                    
+                    if not df.empty:
+                        tables.append(df)
+    
+    return tables
+
+
 def clean_table_data(table: pd.DataFrame, assume_header: bool = True) -> pd.DataFrame:
     """清理表格数据"""
     if table is None or table.empty:
         return pd.DataFrame()
     
-    cleaned = table.copy()
-    
-    # 删除完全空的行和列
-    cleaned = cleaned.dropna(how='all')
-    cleaned = cleaned.dropna(axis=1, how='all')
+    # 删除完全空的行和列（每一步都返回新的DataFrame，无需先复制原表格）
+    cleaned = table.dropna(how='all').dropna(axis=1, how='all').reset_index(drop=True).fillna('')
     
     if cleaned.empty:
         return pd.DataFrame()
     
-    cleaned = cleaned.reset_index(drop=True)
-    cleaned = cleaned.fillna('')
-    
     # 清理列名
-    new_columns = []
-    for i, col in enumerate(cleaned.columns):
-        if pd.isna(col) or str(col).strip() == '' or 'Unnamed' in str(col):
-            new_columns.append(f'列_{i+1}')
-        else:
-            new_columns.append(str(col).strip())
-    cleaned.columns = new_columns
+    cleaned.columns = [
+        f'列_{i+1}' if pd.isna(col) or str(col).strip() == '' or 'Unnamed' in str(col) else str(col).strip()
+        for i, col in enumerate(cleaned.columns)
+    ]
     
     # 检查是否有意义的内容
     if assume_header and len(cleaned) < 2:
         return pd.DataFrame()
     
-    non_empty_cells = 0
-    total_cells = cleaned.shape[0] * cleaned.shape[1]
-    
-    for col in cleaned.columns:
-        for val in cleaned[col]:
-            if str(val).strip() != '':
-                non_empty_cells += 1
+    # 一次性转换为字符串数组统计非空单元格（仅含空白的单元格视为空）
+    cells = cleaned.to_numpy(dtype=str)
+    non_empty_cells = int(np.count_nonzero(np.char.strip(cells)))
+    total_cells = cells.size
     
     if total_cells > 0 and (non_empty_cells / total_cells) < 0.1:
         return pd.DataFrame()
@@ -324,86 +610,190 @@ def clean_table_data(table: pd.DataFrame, assume_header: bool = True) -> pd.Data
 
 
 def save_tables_to_xlsx(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str = "") -> None:
-    """保存表格到XLSX文件"""
+    """保存表格到XLSX文件（优先使用xlsxwriter恒定内存模式，否则使用openpyxl）"""
     try:
-        wb = Workbook()
-        wb.remove(wb.active)
+        if XLSXWRITER_AVAILABLE:
+            _write_tables_with_xlsxwriter(tables, xlsx_path, source_pdf)
+        else:
+            _write_tables_with_openpyxl(tables, xlsx_path, source_pdf)
+        print(f"  💾 已保存XLSX文件: {os.path.basename(xlsx_path)}")
         
-        # 定义样式
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+    except Exception as e:
+        raise Exception(f"创建XLSX文件失败: {e}")
+
+
+def _table_sheet_name(index: int, table_count: int) -> str:
+    """获取表格对应的工作表名称"""
+    if table_count == 1:
+        sheet_name = "表格"
+    else:
+        sheet_name = f"表格_{index+1}"
+    
+    return clean_sheet_name(sheet_name)
+
+
+def coerce_numeric_cells(table: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    按列批量将数字文本转换为数字
+    
+    只包含数字、'.'、'-'、','、'%'（且至少有一个数字）的单元格使用pandas的向量化
+    to_numeric解析：去掉千位分隔符，百分比除以100。无法解析的单元格保持原值。
+    
+    返回 (转换后的表格, 标记百分比单元格的布尔表格)
+    """
+    typed_columns = []
+    percent_columns = []
+    
+    for c_idx in range(table.shape[1]):
+        column = table.iloc[:, c_idx]
+        
+        # 数值类型的列已经是数字
+        if not pd.api.types.is_object_dtype(column) and not pd.api.types.is_string_dtype(column):
+            typed_columns.append(column)
+            percent_columns.append(pd.Series(False, index=column.index))
+            continue
+        
+        text = column.astype(str)
+        looks_numeric = text.str.fullmatch(_NUMERIC_TEXT_RE)
+        is_percent = looks_numeric & text.str.contains('%', regex=False)
+        
+        # 百分比只去掉百分号，其他数字只去掉千位分隔符
+        stripped = text.str.replace('%', '', regex=False).where(
+            is_percent, text.str.replace(',', '', regex=False)
         )
-        center_alignment = Alignment(horizontal='center', vertical='center')
+        numbers = pd.to_numeric(stripped.where(looks_numeric), errors='coerce')
+        numbers = numbers.where(~is_percent, numbers / 100)
+        converted = numbers.notna()
         
-        # 处理每个表格
-        for i, table in enumerate(tables):
-            if table.empty:
+        typed_columns.append(column.astype(object).where(~converted, numbers))
+        percent_columns.append(is_percent & converted)
+    
+    typed_table = pd.concat(typed_columns, axis=1) if typed_columns else table.copy()
+    typed_table.columns = table.columns
+    percent_cells = pd.concat(percent_columns, axis=1) if percent_columns else pd.DataFrame(index=table.index)
+    
+    return typed_table, percent_cells
+
+
+def _column_widths(typed_table: pd.DataFrame) -> List[int]:
+    """根据表头和数据的最大文本长度计算列宽（直接在DataFrame上计算，不再遍历单元格）"""
+    header_lengths = [len(str(col)) for col in typed_table.columns]
+    body_lengths = typed_table.astype(str).apply(lambda column: column.str.len().max()).fillna(0).astype(int)
+    
+    return [
+        min(max(max(header_length, body_length) + 2, 10), 50)
+        for header_length, body_length in zip(header_lengths, body_lengths)
+    ]
+
+
+def _write_tables_with_xlsxwriter(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str) -> None:
+    """使用xlsxwriter写入表格，恒定内存模式下逐行写入磁盘"""
+    wb = xlsxwriter.Workbook(xlsx_path, {'constant_memory': True})
+    
+    # 样式只创建一次，所有单元格共用
+    header_format = wb.add_format({
+        'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+        'border': 1, 'align': 'center', 'valign': 'vcenter'
+    })
+    body_format = wb.add_format({'border': 1})
+    percent_format = wb.add_format({'border': 1, 'num_format': '0.0%'})
+    
+    # 处理每个表格
+    sheet_count = 0
+    for i, table in enumerate(tables):
+        if table.empty:
+            continue
+        
+        ws = wb.add_worksheet(_table_sheet_name(i, len(tables)))
+        sheet_count += 1
+        
+        # 数字文本转换为数字
+        typed_table, percent_frame = coerce_numeric_cells(table)
+        percent_cells = percent_frame.to_numpy()
+        
+        # 写入表头
+        header = [str(col) for col in typed_table.columns]
+        ws.write_row(0, 0, header, header_format)
+        
+        # 逐行写入数据，没有百分比的行整行写入
+        body = typed_table.astype(object).where(typed_table.notna(), None)
+        for r_idx, row in enumerate(body.itertuples(index=False, name=None), 1):
+            if not percent_cells[r_idx - 1].any():
+                ws.write_row(r_idx, 0, row, body_format)
                 continue
-                
-            if len(tables) == 1:
-                sheet_name = "表格"
-            else:
-                sheet_name = f"表格_{i+1}"
-            
-            sheet_name = clean_sheet_name(sheet_name)
-            ws = wb.create_sheet(title=sheet_name)
-            
-            # 添加表格数据
-            for r_idx, row in enumerate(dataframe_to_rows(table, index=False, header=True)):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx + 1, column=c_idx, value=value)
-                    cell.border = border
-                    
-                    if r_idx == 0:  # 表头
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = center_alignment
-                    
-                    # 数字格式转换
-                    if r_idx > 0 and isinstance(value, str) and value.strip():
-                        try:
-                            if value.replace('.', '').replace('-', '').replace('%', '').replace(',', '').isdigit():
-                                if '%' in value:
-                                    cell.value = float(value.replace('%', '')) / 100
-                                    cell.number_format = '0.0%'
-                                elif ',' in value:
-                                    cell.value = float(value.replace(',', ''))
-                                else:
-                                    cell.value = float(value)
-                        except (ValueError, AttributeError):
-                            pass
-            
-            # 自动调整列宽
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            for c_idx, value in enumerate(row):
+                ws.write(r_idx, c_idx, value, percent_format if percent_cells[r_idx - 1, c_idx] else body_format)
         
-        # 如果没有有效表格，创建信息表
-        if len(wb.worksheets) == 0:
-            ws = wb.create_sheet(title="信息")
-            ws['A1'] = "PDF文件中未找到有效表格"
-            ws['A2'] = f"源文件: {source_pdf}" if source_pdf else "源文件: 未知"
+        # 自动调整列宽
+        for c_idx, width in enumerate(_column_widths(typed_table)):
+            ws.set_column(c_idx, c_idx, width)
+    
+    # 如果没有有效表格，创建信息表
+    if sheet_count == 0:
+        ws = wb.add_worksheet("信息")
+        ws.write(0, 0, "PDF文件中未找到有效表格")
+        ws.write(1, 0, f"源文件: {source_pdf}" if source_pdf else "源文件: 未知")
+    
+    wb.close()
+
+
+def _write_tables_with_openpyxl(tables: List[pd.DataFrame], xlsx_path: str, source_pdf: str) -> None:
+    """使用openpyxl只写模式逐行写入表格（未安装xlsxwriter时使用）"""
+    wb = Workbook(write_only=True)
+    
+    # 定义样式
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    center_alignment = Alignment(horizontal='center', vertical='center')
+    
+    # 样式只在工作簿中注册一次，单元格按名称引用
+    wb.add_named_style(NamedStyle(name='hdr', font=header_font, fill=header_fill, border=border, alignment=center_alignment))
+    wb.add_named_style(NamedStyle(name='data', font=DEFAULT_FONT, border=border))
+    wb.add_named_style(NamedStyle(name='pct', font=DEFAULT_FONT, border=border, number_format='0.0%'))
+    
+    # 处理每个表格
+    for i, table in enumerate(tables):
+        if table.empty:
+            continue
         
-        wb.save(xlsx_path)
-        print(f"  💾 已保存XLSX文件: {os.path.basename(xlsx_path)}")
+        ws = wb.create_sheet(title=_table_sheet_name(i, len(tables)))
         
-    except Exception as e:
-        raise Exception(f"创建XLSX文件失败: {e}")
+        # 数字文本转换为数字
+        typed_table, percent_frame = coerce_numeric_cells(table)
+        percent_cells = percent_frame.to_numpy()
+        
+        # 只写模式下列宽必须在写入数据之前设置
+        for c_idx, width in enumerate(_column_widths(typed_table), 1):
+            ws.column_dimensions[get_column_letter(c_idx)].width = width
+        
+        # 逐行写入带样式的单元格，写入后不再保留在内存中
+        ws.append([_styled_cell(ws, value, 'hdr') for value in typed_table.columns])
+        for row, percent_row in zip(typed_table.itertuples(index=False, name=None), percent_cells):
+            ws.append([
+                _styled_cell(ws, value, 'pct' if is_percent else 'data')
+                for value, is_percent in zip(row, percent_row)
+            ])
+    
+    # 如果没有有效表格，创建信息表
+    if len(wb.worksheets) == 0:
+        ws = wb.create_sheet(title="信息")
+        ws.append(["PDF文件中未找到有效表格"])
+        ws.append([f"源文件: {source_pdf}" if source_pdf else "源文件: 未知"])
+    
+    wb.save(xlsx_path)
+
+
+def _styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    """创建使用指定命名样式的只写单元格"""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
 
 
 def clean_sheet_name(name: str) -> str:
@@ -421,8 +811,8 @@ def clean_sheet_name(name: str) -> str:
     return name
 
 
-def convert_single_pdf_to_xlsx(pdf_path: str, output_path: str = None) -> bool:
-    """转换单个PDF文件到XLSX格式"""
+def convert_single_pdf_to_xlsx(pdf_path: str, output_path: str = None, overwrite: bool = False) -> bool:
+    """转换单个PDF文件到XLSX格式（overwrite为True时输出文件已存在也不再询问）"""
     # 检查PDF文件是否存在
     if not os.path.exists(pdf_path):
         print(f"❌ 错误: PDF文件不存在: {pdf_path}")
@@ -430,15 +820,12 @@ def convert_single_pdf_to_xlsx(pdf_path: str, output_path: str = None) -> bool:
     
     # 如果没有指定输出路径，生成默认路径
     if output_path is None:
-        base_name = os.path.splitext(pdf_path)[0]
-        output_path = f"{base_name}.xlsx"
+        output_path = default_xlsx_path(pdf_path)
     
     # 检查输出文件是否已存在
-    if os.path.exists(output_path):
-        response = input(f"⚠️  文件 '{output_path}' 已存在，是否覆盖? (y/n): ").strip().lower()
-        if response not in ['y', 'yes', '是']:
-            print("❌ 转换已取消")
-            return False
+    if not overwrite and os.path.exists(output_path) and not confirm_overwrite(output_path):
+        print("❌ 转换已取消")
+        return False
     
     print(f"🔄 开始转换: {os.path.basename(pdf_path)} → {os.path.basename(output_path)}")
     
@@ -474,6 +861,96 @@ def convert_single_pdf_to_xlsx(pdf_path: str, output_path: str = None) -> bool:
         return False
 
 
+def default_xlsx_path(pdf_path: str) -> str:
+    """获取PDF文件默认的输出路径（同名的.xlsx文件）"""
+    return f"{os.path.splitext(pdf_path)[0]}.xlsx"
+
+
+def confirm_overwrite(output_path: str) -> bool:
+    """询问是否覆盖已存在的输出文件（接受 y / yes / 是，没有输入时视为不覆盖）"""
+    try:
+        response = input(f"⚠️  文件 '{output_path}' 已存在，是否覆盖? (y/n): ").strip().lower()
+    except (EOFError, KeyboardInterrupt):
+        print()
+        return False
+    
+    return response in ['y', 'yes', '是']
+
+
+def convert_pdfs_to_xlsx(pdf_paths: List[str]) -> List[bool]:
+    """
+    同时转换多个PDF文件，每个文件保存到同名的XLSX文件
+    
+    是否覆盖已存在的文件在提交前由当前进程统一询问，工作进程不会等待输入。每个工作进程
+    有自己的JVM，一个文件出错不影响其他文件；工作进程的输出由当前进程按文件整块打印。
+    重复传入的文件只转换一次。返回每个文件是否转换成功。
+    """
+    # 先询问所有需要覆盖的文件，用户拒绝的文件不再转换。去掉重复的路径，
+    # 避免同时向同一个输出文件写入
+    to_convert = []
+    for pdf_path in dict.fromkeys(pdf_paths):
+        output_path = default_xlsx_path(pdf_path)
+        if os.path.exists(output_path) and not confirm_overwrite(output_path):
+            print(f"❌ 转换已取消: {os.path.basename(pdf_path)}")
+        else:
+            to_convert.append(pdf_path)
+    
+    workers = min(os.cpu_count() or 1, len(to_convert))
+    results = dict.fromkeys(pdf_paths, False)
+    
+    # 只有一个文件或只有一个CPU时，在当前进程中依次转换
+    if workers <= 1:
+        for pdf_path in to_convert:
+            results[pdf_path] = convert_single_pdf_to_xlsx(pdf_path, overwrite=True)
+        return [results[pdf_path] for pdf_path in pdf_paths]
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_batch_worker
+    ) as executor:
+        futures = {
+            executor.submit(_convert_single_captured, pdf_path): pdf_path
+            for pdf_path in to_convert
+        }
+        
+        # 逐个收集结果，一个工作进程出错不影响已完成文件的结果
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                results[pdf_path], output = future.result()
+                print(output, end='', flush=True)
+            except Exception as e:
+                print(f"❌ 转换失败: {os.path.basename(pdf_path)}: {e}")
+    
+    return [results[pdf_path] for pdf_path in pdf_paths]
+
+
+def _convert_single_captured(pdf_path: str) -> tuple[bool, str]:
+    """在工作进程中转换一个文件并捕获它的输出，返回 (是否成功, 输出)，由主进程整块打印"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            success = convert_single_pdf_to_xlsx(pdf_path, None, True)
+        except Exception as e:
+            print(f"❌ 转换失败: {os.path.basename(pdf_path)}: {e}")
+            success = False
+    
+    return success, output.getvalue()
+
+
+def _init_batch_worker() -> None:
+    """
+    初始化批量转换的工作进程
+    
+    多个文件已经按进程并行，pdfplumber不再在工作进程中启动自己的进程池；工作进程退出时
+    关闭它启动的JVM。
+    """
+    global _pdfplumber_pool_allowed
+    _pdfplumber_pool_allowed = False
+    multiprocessing.util.Finalize(None, shutdown_jvm, exitpriority=10)
+
+
 def main():
     """主函数"""
     print("PDF to XLSX 单文件转换器")
@@ -487,10 +964,31 @@ def main():
     if len(sys.argv) < 2:
         print("\n使用方法:")
         print(f"  python {os.path.basename(__file__)} <PDF文件路径> [输出文件路径]")
+        print(f"  python {os.path.basename(__file__)} <PDF文件路径> <PDF文件路径> ...")
         print()
         print("示例:")
         print(f"  python {os.path.basename(__file__)} pdf2excel.pdf")
         print(f"  python {os.path.basename(__file__)} pdf2excel.pdf output.xlsx")
+        print(f"  python {os.path.basename(__file__)} a.pdf b.pdf c.pdf")
+        return
+    
+    # 多个PDF文件参数时同时转换
+    pdf_files = sys.argv[1:]
+    if len(pdf_files) > 1 and all(path.lower().endswith('.pdf') for path in pdf_files):
+        print(f"\n🎯 准备转换{len(pdf_files)}个PDF文件")
+        
+        try:
+            results = convert_pdfs_to_xlsx(pdf_files)
+        finally:
+            shutdown_jvm()
+        
+        success_count = sum(results)
+        print(f"\n📊 转换完成: {success_count}/{len(pdf_files)} 个文件成功")
+        for pdf_file, success in zip(pdf_files, results):
+            if not success:
+                print(f"   ❌ {pdf_file}")
+        
+        print("=" * 40)
         return
     
     pdf_file = sys.argv[1]
@@ -499,7 +997,10 @@ def main():
     print(f"\n🎯 准备转换PDF文件: {pdf_file}")
     
     # 执行转换
-    success = convert_single_pdf_to_xlsx(pdf_file, output_file)
+    try:
+        success = convert_single_pdf_to_xlsx(pdf_file, output_file)
+    finally:
+        shutdown_jvm()
     
     if success:
         print("\n🎉 转换完成!")